@@ -8,8 +8,11 @@ Options:
     --clean         Clean build directories before building
     --installer     Build installer (requires Inno Setup)
     --zip           Create ZIP distribution package
+    --zstd          Also create a .tar.zst package (requires zstandard)
     --all           Build everything (default)
     --no-deps       Skip dependency installation (faster rebuild)
+    --pywin32-postinstall
+                    Run pywin32's post-install step in the build venv
     --verbose       Show detailed output
 Examples:
     python build.py                 # Full build with everything
@@ -18,17 +21,24 @@ Examples:
     python build.py --zip           # Build executable and ZIP only
 """
 import argparse
+import re
 import subprocess
+import threading
 import sys
 import shutil
 import os
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 APP_NAME = "CorelDRAW Automation Toolkit"
 APP_VERSION = "0.1.0-beta"
 PYTHON_MIN_VERSION = (3, 8)
 PYTHON_MAX_VERSION = (3, 11)
+# Already-compressed formats gain nothing from DEFLATE
+STORED_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.ico', '.whl', '.zip'}
+# PyInstaller output lines worth showing on the console without --verbose
+PYINSTALLER_ECHO = re.compile(r'WARNING|ERROR|Traceback|Exception|completed successfully')
 
 class BuildError(Exception):
     """Custom exception for build errors."""
@@ -63,26 +73,46 @@ def check_python_version():
 def clean_build_dirs(project_root):
     """Remove build directories."""
     dirs_to_clean = ['build', 'dist', '__pycache__']
-    
-    for dir_name in dirs_to_clean:
-        dir_path = project_root / dir_name
-        if dir_path.exists():
-            log(f"Cleaning {dir_name}...")
-            try:
-                shutil.rmtree(dir_path)
-            except Exception as e:
-                log(f"Warning: Could not remove {dir_name}: {e}", "WARNING")
+    paths = [project_root / dir_name for dir_name in dirs_to_clean]
+    paths.extend((project_root / 'src').rglob('__pycache__'))
+    paths = [dir_path for dir_path in paths if dir_path.exists()]
+    if not paths:
+        return
+
+    def remove(dir_path):
+        name = dir_path.relative_to(project_root)
+        log(f"Cleaning {name}...")
+        try:
+            shutil.rmtree(dir_path)
+        except Exception as e:
+            log(f"Warning: Could not remove {name}: {e}", "WARNING")
 
-def create_venv(project_root):
+    # The trees are independent, so delete them concurrently
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+        list(executor.map(remove, paths))
+
+def find_uv():
+    """Return the path to the uv executable, or None if it is not installed."""
+    return shutil.which('uv')
+
+def create_venv(project_root, uv=None, reuse=False):
     """Create virtual environment for building."""
     venv_dir = project_root / 'build_venv'
+    if reuse and (venv_dir / 'Scripts' / 'python.exe').exists():
+        log("Reusing existing virtual environment (--no-deps)")
+        return venv_dir
     if venv_dir.exists():
         log("Removing old virtual environment...")
         shutil.rmtree(venv_dir)
-    log("Creating virtual environment...")
+    if uv:
+        log("Creating virtual environment with uv...")
+        venv_cmd = [uv, 'venv', '--python', sys.executable, str(venv_dir)]
+    else:
+        log("Creating virtual environment...")
+        venv_cmd = [sys.executable, '-m', 'venv', str(venv_dir)]
     try:
         subprocess.run(
-            [sys.executable, '-m', 'venv', str(venv_dir)],
+            venv_cmd,
             check=True,
             capture_output=True
         )
@@ -90,37 +120,59 @@ def create_venv(project_root):
         raise BuildError(f"Failed to create virtual environment: {e}")
     return venv_dir
 
-def install_dependencies(venv_dir, skip_deps=False):
+def install_dependencies(venv_dir, skip_deps=False, uv=None, pywin32_postinstall=False):
     """Install required dependencies."""
     if skip_deps:
         log("Skipping dependency installation (--no-deps)")
         return
-    pip = venv_dir / 'Scripts' / 'pip.exe'
-    log("Upgrading pip...")
-    subprocess.run(
-        [str(pip), 'install', '--upgrade', 'pip'],
-        check=True
-    )
+    python = venv_dir / 'Scripts' / 'python.exe'
+    if uv:
+        install_cmd = [uv, 'pip', 'install', '--python', str(python)]
+    else:
+        pip = venv_dir / 'Scripts' / 'pip.exe'
+        log("Upgrading pip...")
+        subprocess.run(
+            [str(pip), 'install', '--upgrade', 'pip'],
+            check=True
+        )
+        install_cmd = [
+            str(pip), 'install',
+            '--no-input', '--disable-pip-version-check', '--no-python-version-warning',
+        ]
     dependencies = [
         ('PyQt5', '5.15.10'),
         ('pywin32', '306'),
         ('pillow', '10.2.0'),
         ('pyinstaller', '6.3.0'),
     ]
-    for package, version in dependencies:
-        log(f"Installing {package}=={version}...")
-        try:
-            subprocess.run(
-                [str(pip), 'install', f'{package}=={version}'],
-                check=True
-            )
-        except subprocess.CalledProcessError as e:
-            raise BuildError(f"Failed to install {package}: {e}")
-    
+    requirements = [f'{package}=={version}' for package, version in dependencies]
+    log(f"Installing {', '.join(requirements)}...")
+    try:
+        subprocess.run(
+            [*install_cmd, *requirements],
+            check=True
+        )
+    except subprocess.CalledProcessError:
+        # Retry one package at a time so the failing one is reported by name
+        log("Batch install failed, retrying packages individually...", "WARNING")
+        for package, version in dependencies:
+            log(f"Installing {package}=={version}...")
+            try:
+                subprocess.run(
+                    [*install_cmd, f'{package}=={version}'],
+                    check=True
+                )
+            except subprocess.CalledProcessError as e:
+                raise BuildError(f"Failed to install {package}: {e}")
+
+    # PyInstaller's pywin32 hooks collect pywintypes/pythoncom DLLs straight
+    # from the wheel, so copying them into the interpreter is not needed
+    if not pywin32_postinstall:
+        return
     log("Running pywin32 post-install...")
     try:
         subprocess.run(
-            [str(venv_dir / 'Scripts' / 'python.exe'), '-m', 'pywin32_postinstall', '-install', '-silent'],
+            [str(python), '-m', 'pywin32_postinstall', '-install', '-silent'],
             check=False,
             capture_output=True
         )
@@ -128,28 +180,52 @@ def install_dependencies(venv_dir, skip_deps=False):
         pass 
 
 
-def build_executable(project_root, venv_dir):
+def _pump_output(stream, log_file, verbose):
+    """Copy child output to the build log, echoing only notable lines."""
+    with open(log_file, 'w', encoding='utf-8') as fh:
+        for line in stream:
+            fh.write(line)
+            if verbose or PYINSTALLER_ECHO.search(line):
+                sys.stdout.write(line)
+
+def build_executable(project_root, venv_dir, verbose=False):
     """Build executable with PyInstaller."""
     log("Building executable with PyInstaller...")
     log("This may take 5-15 minutes depending on your system...")
     
     pyinstaller = venv_dir / 'Scripts' / 'pyinstaller.exe'
     spec_file = project_root / 'CorelDRAW_Automation_Toolkit.spec'
+    log_file = project_root / 'build.log'
+    log(f"Full PyInstaller output: {log_file}")
     
-    try:
-        result = subprocess.run(
-            [
-                str(pyinstaller),
-                str(spec_file),
-                '--clean',
-                '--noconfirm'
-            ],
-            check=True,
-            capture_output=False
-        )
-    except subprocess.CalledProcessError as e:
+    # Writing every line to a Windows console is slow, so the full output
+    # goes to build.log and only warnings/errors are echoed
+    process = subprocess.Popen(
+        [
+            str(pyinstaller),
+            str(spec_file),
+            '--clean',
+            '--noconfirm'
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=1,
+        text=True,
+        encoding='utf-8',
+        errors='replace'
+    )
+    reader = threading.Thread(
+        target=_pump_output,
+        args=(process.stdout, log_file, verbose),
+        daemon=True
+    )
+    reader.start()
+    returncode = process.wait()
+    reader.join()
+    if returncode != 0:
         raise BuildError(
-            f"PyInstaller build failed with code {e.returncode}\n"
+            f"PyInstaller build failed with code {returncode}\n"
+            f"See {log_file} for details\n"
             "Common issues:\n"
             "  - Missing dependencies\n"
             "  - Permission denied (run as Administrator)\n"
@@ -202,6 +278,16 @@ def build_installer(project_root):
         log(f"Installer size: {installer_size / (1024*1024):.2f} MB")
         return installer_path
     return None
+def iter_files(root, prefix=''):
+    """Yield (path, archive name) for every file below root using os.scandir."""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            arcname = prefix + entry.name
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_files(entry.path, arcname + '/')
+            elif entry.is_file():
+                yield entry.path, arcname
+
 def create_zip_package(project_root):
     """Create ZIP distribution package."""
     log("Creating ZIP distribution package...")
@@ -214,11 +300,13 @@ def create_zip_package(project_root):
     try:
         import zipfile
         source_dir = dist_dir / 'CorelDRAW_Automation_Toolkit'
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for file_path in source_dir.rglob('*'):
-                if file_path.is_file():
-                    arcname = file_path.relative_to(source_dir)
-                    zipf.write(file_path, arcname)
+        # Level 1 keeps most of the size reduction for DLL/PYD payloads at a
+        # fraction of the CPU cost of the default level 6
+        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
+            for file_path, arcname in iter_files(str(source_dir)):
+                ext = os.path.splitext(arcname)[1].lower()
+                compress_type = zipfile.ZIP_STORED if ext in STORED_EXTENSIONS else None
+                zipf.write(file_path, arcname, compress_type=compress_type)
         zip_size = zip_path.stat().st_size
         log(f"ZIP package created: {zip_path}")
         log(f"ZIP size: {zip_size / (1024*1024):.2f} MB")
@@ -226,7 +314,34 @@ def create_zip_package(project_root):
     except Exception as e:
         log(f"Failed to create ZIP: {e}", "WARNING")
         return None
-def print_summary(project_root, exe_path, installer_path, zip_path):
+def create_zstd_package(project_root):
+    """Create multi-threaded zstd-compressed tarball of the distribution."""
+    log("Creating tar.zst distribution package...")
+    try:
+        import zstandard
+    except ImportError:
+        log("zstandard not installed (pip install zstandard). Skipping tar.zst.", "WARNING")
+        return None
+    import tarfile
+
+    dist_dir = project_root / 'dist'
+    tar_path = dist_dir / f'CorelDRAW_Automation_Toolkit_{APP_VERSION}.tar.zst'
+    source_dir = dist_dir / 'CorelDRAW_Automation_Toolkit'
+    root_name = source_dir.name + '/'
+    try:
+        cctx = zstandard.ZstdCompressor(level=10, threads=-1)
+        with open(tar_path, 'wb') as fh, cctx.stream_writer(fh) as compressor:
+            with tarfile.open(fileobj=compressor, mode='w|') as tar:
+                for file_path, arcname in iter_files(str(source_dir)):
+                    tar.add(file_path, arcname=root_name + arcname, recursive=False)
+        tar_size = tar_path.stat().st_size
+        log(f"tar.zst package created: {tar_path}")
+        log(f"tar.zst size: {tar_size / (1024*1024):.2f} MB")
+        return tar_path
+    except Exception as e:
+        log(f"Failed to create tar.zst: {e}", "WARNING")
+        return None
+def print_summary(project_root, exe_path, installer_path, zip_path, tar_path=None):
     """Print build summary."""
     print("\n" + "="*60)
     print("BUILD COMPLETE")
@@ -243,6 +358,11 @@ def print_summary(project_root, exe_path, installer_path, zip_path):
         print(f"     {zip_path}")
         print(f"     Size: {zip_path.stat().st_size / (1024*1024):.2f} MB")
         print()
+    if tar_path and tar_path.exists():
+        print(f"[OK] tar.zst Package:")
+        print(f"     {tar_path}")
+        print(f"     Size: {tar_path.stat().st_size / (1024*1024):.2f} MB")
+        print()
     if installer_path and installer_path.exists():
         print(f"[OK] Windows Installer:")
         print(f"     {installer_path}")
@@ -253,6 +373,9 @@ def print_summary(project_root, exe_path, installer_path, zip_path):
     print("\nOption 1: Share the ZIP file (Easiest)")
     print("  - Copy the ZIP file and share via email/cloud")
     print("  - User extracts and runs the executable")
+    if tar_path and tar_path.exists():
+        print("  - For cloud transfer, the smaller tar.zst can be unpacked with")
+        print("    'tar --zstd -xf' on systems with zstd installed")
     print("\nOption 2: Share the Installer (Professional)")
     print("  - Creates Start Menu shortcuts")
     print("  - Adds uninstall option in Control Panel")
@@ -275,11 +398,14 @@ def main():
     parser.add_argument('--clean', action='store_true', help='Clean build directories first')
     parser.add_argument('--installer', action='store_true', help='Build installer')
     parser.add_argument('--zip', action='store_true', help='Create ZIP package')
+    parser.add_argument('--zstd', action='store_true', help='Create tar.zst package')
     parser.add_argument('--all', action='store_true', help='Build everything (default)')
     parser.add_argument('--no-deps', action='store_true', help='Skip dependency installation')
+    parser.add_argument('--pywin32-postinstall', action='store_true',
+                        help="Run pywin32's post-install step in the build venv")
     parser.add_argument('--verbose', action='store_true', help='Show detailed output')
     args = parser.parse_args()
-    if not (args.installer or args.zip):
+    if not (args.installer or args.zip or args.zstd):
         args.all = True
     print("="*60)
     print(f"{APP_NAME} Builder")
@@ -289,23 +415,39 @@ def main():
     try:
         project_root = Path(__file__).parent.parent
         check_python_version()
+        uv = find_uv()
+        if uv:
+            log(f"Using uv for environment setup: {uv}")
         if args.clean:
             clean_build_dirs(project_root)
-        venv_dir = create_venv(project_root)
-        install_dependencies(venv_dir, skip_deps=args.no_deps)
-        exe_path = build_executable(project_root, venv_dir)
+        # --no-deps only makes sense with a populated venv from a previous
+        # --no-deps run; otherwise build one from scratch this time
+        venv_dir = project_root / 'build_venv'
+        reuse_venv = args.no_deps and (venv_dir / 'Scripts' / 'python.exe').exists()
+        if args.no_deps and not reuse_venv:
+            log("No reusable virtual environment found, installing dependencies", "WARNING")
+        venv_dir = create_venv(project_root, uv=uv, reuse=reuse_venv)
+        install_dependencies(venv_dir, skip_deps=reuse_venv, uv=uv,
+                             pywin32_postinstall=args.pywin32_postinstall)
+        exe_path = build_executable(project_root, venv_dir, verbose=args.verbose)
         installer_path = None
         zip_path = None
+        tar_path = None
         if args.all or args.installer:
             installer_path = build_installer(project_root)
         if args.all or args.zip:
             zip_path = create_zip_package(project_root)
-        log("Cleaning up...")
-        try:
-            shutil.rmtree(venv_dir)
-        except:
-            pass
-        print_summary(project_root, exe_path, installer_path, zip_path)
+        if args.zstd:
+            tar_path = create_zstd_package(project_root)
+        if args.no_deps:
+            log("Keeping build_venv for the next --no-deps rebuild")
+        else:
+            log("Cleaning up...")
+            try:
+                shutil.rmtree(venv_dir)
+            except:
+                pass
+        print_summary(project_root, exe_path, installer_path, zip_path, tar_path)
         return 0
     except BuildError as e:
         log(f"Build failed: {e}", "ERROR")
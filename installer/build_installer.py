@@ -4,12 +4,31 @@ Build script for creating Windows executable and installer.
 Uses PyInstaller to create standalone .exe file.
 """
 
+import os
 import subprocess
 import sys
 import shutil
 from pathlib import Path
 
 
+def walk_size(root):
+    """Return the total size in bytes of all files below root.
+
+    Uses os.scandir so each entry costs a single cached stat, instead of the
+    is_file() + stat() pair per Path that rglob needs.
+    """
+    total = 0
+    stack = [os.fspath(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+    return total
+
+
 def main():
     """Build the Windows executable."""
     print("=" * 60)
@@ -52,6 +71,7 @@ def main():
         f"--specpath={build_dir}",
         f"--add-data={project_root / 'README.md'};.",
         f"--add-data={project_root / 'LICENSE'};.",
+        f"--add-data={src_dir / 'resources' / 'themes'};resources/themes",
         "--hidden-import=win32com.gen_py",
         "--hidden-import=pythoncom",
         "--hidden-import=pywintypes",
@@ -90,7 +110,7 @@ def main():
     print(f"\nExecutable created at: {dist_app_dir}")
     print(f"Run: {dist_app_dir / 'CorelDRAW_Automation_Toolkit.exe'}")
 
-    total_size = sum(f.stat().st_size for f in dist_app_dir.rglob('*') if f.is_file())
+    total_size = walk_size(dist_app_dir)
     print(f"\nTotal size: {total_size / (1024*1024):.1f} MB")
 
     print("\n" + "=" * 60)
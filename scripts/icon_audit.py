@@ -11,7 +11,7 @@ project_root = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(project_root))
 
 from PyQt5.QtWidgets import QApplication, QPushButton, QWidget, QVBoxLayout, QGridLayout, QLabel, QScrollArea
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import QCoreApplication, QEvent, Qt
 
 from src.ui.main_window import MainWindow
 from src.tools.curve_filler.curve_filler_widget import CurveFillerWidget
@@ -29,38 +29,50 @@ def _norm(text: str) -> str:
     return text.replace("&", "").strip()
 
 
-def audit_widget(widget, name: str) -> None:
+def collect_buttons(widget):
+    """Snapshot (text, icon, icon size) for every QPushButton under widget."""
+    # QIcon/QSize are value types, so the records outlive the source widget
+    return [(btn.text(), btn.icon(), btn.iconSize()) for btn in widget.findChildren(QPushButton)]
+
+
+def audit_widget(name: str, buttons) -> None:
     print(f"\n=== {name} ===")
-    buttons = widget.findChildren(QPushButton)
     if not buttons:
         print("No QPushButton found.")
         return
-    for btn in buttons:
-        icon = btn.icon()
-        size = btn.iconSize()
-        text = _norm(btn.text())
+    for text, icon, size in buttons:
         has_icon = "yes" if not icon.isNull() else "no"
-        print(f"- {text or '<no text>'}: icon={has_icon} size={size.width()}x{size.height()}")
+        print(f"- {_norm(text) or '<no text>'}: icon={has_icon} size={size.width()}x{size.height()}")
 
 
 def main() -> int:
     app = QApplication(sys.argv)
 
-    widgets = [
-        (MainWindow(), "MainWindow"),
-        (CurveFillerWidget(), "CurveFillerWidget"),
-        (RhinestoneWidget(), "RhinestoneWidget"),
-        (BatchProcessorWidget(), "BatchProcessorWidget"),
-        (ObjectToolsWidget(), "ObjectToolsWidget"),
-        (TypographyWidget(), "TypographyWidget"),
-        (PresetBrowser(), "PresetBrowser"),
-        (HelpDialog(), "HelpDialog"),
-        (SettingsDialog(), "SettingsDialog"),
-        (AboutDialog(), "AboutDialog"),
+    factories = [
+        (MainWindow, "MainWindow"),
+        (CurveFillerWidget, "CurveFillerWidget"),
+        (RhinestoneWidget, "RhinestoneWidget"),
+        (BatchProcessorWidget, "BatchProcessorWidget"),
+        (ObjectToolsWidget, "ObjectToolsWidget"),
+        (TypographyWidget, "TypographyWidget"),
+        (PresetBrowser, "PresetBrowser"),
+        (HelpDialog, "HelpDialog"),
+        (SettingsDialog, "SettingsDialog"),
+        (AboutDialog, "AboutDialog"),
     ]
 
-    for widget, name in widgets:
-        audit_widget(widget, name)
+    # Build one widget at a time and release it once its buttons are recorded,
+    # so peak memory is a single widget tree rather than all of them.
+    # processEvents() skips DeferredDelete outside a running event loop, so
+    # the posted deletion is dispatched explicitly
+    buttons_by_widget = []
+    for factory, name in factories:
+        widget = factory()
+        buttons = collect_buttons(widget)
+        widget.deleteLater()
+        QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+        audit_widget(name, buttons)
+        buttons_by_widget.append((name, buttons))
 
     preview = QWidget()
     preview.setWindowTitle("Icon Preview")
@@ -79,24 +91,24 @@ def main() -> int:
     col = 0
     max_cols = 3
 
-    for widget, name in widgets:
+    for name, buttons in buttons_by_widget:
         title = QLabel(name)
         title.setStyleSheet("font-weight: bold;")
         title.setAlignment(Qt.AlignLeft)
         grid.addWidget(title, row, 0, 1, max_cols)
         row += 1
 
-        for btn in widget.findChildren(QPushButton):
-            label = QLabel(btn.text() or "<no text>")
+        for text, icon, size in buttons:
+            label = QLabel(text or "<no text>")
             label.setMinimumWidth(200)
-            sample = QPushButton(btn.text())
-            sample.setIcon(btn.icon())
-            sample.setIconSize(btn.iconSize())
+            sample = QPushButton(text)
+            sample.setIcon(icon)
+            sample.setIconSize(size)
             sample.setEnabled(False)
 
             grid.addWidget(label, row, 0)
             grid.addWidget(sample, row, 1)
-            size_label = QLabel(f"{btn.iconSize().width()}x{btn.iconSize().height()}")
+            size_label = QLabel(f"{size.width()}x{size.height()}")
             grid.addWidget(size_label, row, 2)
 
             row += 1
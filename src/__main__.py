@@ -0,0 +1,9 @@
+"""
+Allow running the toolkit with `python -m src`.
+"""
+
+import sys
+
+from src.main import main
+
+sys.exit(main())
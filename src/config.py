@@ -3,15 +3,31 @@ Application Configuration Module
 Handles all application settings, preferences, and configuration management.
 """
 
+import atexit
 import json
 import os
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
-from dataclasses import dataclass, asdict
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+from dataclasses import dataclass, fields
 import logging
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None
+
+from .utils.file_utils import atomic_write_bytes
+
 logger = logging.getLogger(__name__)
 
+# Delay before a deferred save is written, so bursts of changes coalesce
+SAVE_DEBOUNCE_SECONDS = 2.0
+
 
 @dataclass
 class AppSettings:
@@ -79,6 +95,71 @@ class BatchProcessorSettings:
     max_threads: int = 4
 
 
+# Field names per settings section, computed once. All sections are flat
+# dataclasses of primitives, so a shallow dict is equivalent to asdict()
+# without its per-call reflection and deepcopy recursion.
+_SECTION_FIELDS: Dict[type, tuple] = {
+    cls: tuple(f.name for f in fields(cls))
+    for cls in (AppSettings, UnitSettings, CurveFillerSettings,
+                RhinestoneSettings, BatchProcessorSettings)
+}
+
+
+def _section_to_dict(section: Any) -> Dict[str, Any]:
+    """Serialize a flat settings dataclass to a plain dict."""
+    return {name: getattr(section, name) for name in _SECTION_FIELDS[type(section)]}
+
+
+# ConfigurationManager attributes holding each settings section
+_SECTION_ATTRS = ('app', 'units', 'curve_filler', 'rhinestone', 'batch_processor')
+
+
+# Default values per section, built once
+_SECTION_DEFAULTS: Dict[type, Dict[str, Any]] = {
+    cls: _section_to_dict(cls()) for cls in _SECTION_FIELDS
+}
+
+
+def _section_from_dict(cls: type, data: Dict[str, Any]) -> Any:
+    """
+    Build a settings dataclass from saved data without running __init__.
+
+    Keys missing from older config files fall back to defaults and keys
+    no longer known are ignored, instead of raising TypeError.
+    """
+    defaults = _SECTION_DEFAULTS[cls]
+    section = object.__new__(cls)
+    section.__dict__.update(defaults)
+    section.__dict__.update((k, v) for k, v in data.items() if k in defaults)
+    return section
+
+
+# Subdirectories created under the configuration directory
+_CONFIG_SUBDIRS = ('presets', 'cache', 'plugins', 'templates', 'logs')
+
+
+@lru_cache(maxsize=None)
+def _ensure_dirs(root: Path):
+    """Create the configuration directory tree once per root per process."""
+    for sub in _CONFIG_SUBDIRS:
+        (root / sub).mkdir(parents=True, exist_ok=True)
+
+
+# Default keyboard shortcuts; copy before handing out for editing
+_DEFAULT_HOTKEYS: Mapping[str, str] = MappingProxyType({
+    'fill_curve': 'Ctrl+F',
+    'preview': 'Ctrl+P',
+    'undo': 'Ctrl+Z',
+    'redo': 'Ctrl+Y',
+    'advanced_fill': 'Ctrl+Shift+F',
+    'save_preset': 'Ctrl+S',
+    'load_preset': 'Ctrl+O',
+    'toggle_preview': 'F5',
+    'randomize': 'Ctrl+R',
+    'settings': 'Ctrl+,',
+})
+
+
 class ConfigurationManager:
     """
     Central configuration manager for the application.
@@ -112,8 +193,8 @@ class ConfigurationManager:
         self.rhinestone = RhinestoneSettings()
         self.batch_processor = BatchProcessorSettings()
 
-        # Recent files list
-        self.recent_files: list = []
+        # Recent files, oldest first; a dict is used as an ordered set
+        self._recent_files: Dict[str, None] = {}
 
         # Favorite presets
         self.favorite_presets: list = []
@@ -121,6 +202,15 @@ class ConfigurationManager:
         # Custom hotkeys
         self.hotkeys: Dict[str, str] = {}
 
+        # Deferred save state (see schedule_save)
+        self._save_lock = threading.RLock()
+        self._save_timer: Optional[threading.Timer] = None
+        self._dirty = False
+        # Bytes last written to settings.json; an identical payload is not
+        # written again
+        self._saved_payload: Optional[bytes] = None
+        atexit.register(self.flush)
+
         # Initialize directories and load config
         self._ensure_directories()
         self.load()
@@ -139,12 +229,7 @@ class ConfigurationManager:
 
     def _ensure_directories(self):
         """Ensure all required directories exist."""
-        self._config_dir.mkdir(parents=True, exist_ok=True)
-        self._presets_dir.mkdir(exist_ok=True)
-        self._cache_dir.mkdir(exist_ok=True)
-        (self._config_dir / 'plugins').mkdir(exist_ok=True)
-        (self._config_dir / 'templates').mkdir(exist_ok=True)
-        (self._config_dir / 'logs').mkdir(exist_ok=True)
+        _ensure_dirs(self._config_dir)
 
     def load(self) -> bool:
         """
@@ -159,24 +244,25 @@ class ConfigurationManager:
                 self.save()  # Create default config
                 return True
 
-            with open(self._config_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            raw = self._config_file.read_bytes()
+            data = orjson.loads(raw) if HAS_ORJSON else json.loads(raw.decode('utf-8'))
 
             # Load each section
             if 'app' in data:
-                self.app = AppSettings(**data['app'])
+                self.app = _section_from_dict(AppSettings, data['app'])
             if 'units' in data:
-                self.units = UnitSettings(**data['units'])
+                self.units = _section_from_dict(UnitSettings, data['units'])
             if 'curve_filler' in data:
-                self.curve_filler = CurveFillerSettings(**data['curve_filler'])
+                self.curve_filler = _section_from_dict(CurveFillerSettings, data['curve_filler'])
             if 'rhinestone' in data:
-                self.rhinestone = RhinestoneSettings(**data['rhinestone'])
+                self.rhinestone = _section_from_dict(RhinestoneSettings, data['rhinestone'])
             if 'batch_processor' in data:
-                self.batch_processor = BatchProcessorSettings(**data['batch_processor'])
+                self.batch_processor = _section_from_dict(BatchProcessorSettings, data['batch_processor'])
 
             self.recent_files = data.get('recent_files', [])
             self.favorite_presets = data.get('favorite_presets', [])
-            self.hotkeys = data.get('hotkeys', self._get_default_hotkeys())
+            self.hotkeys = data['hotkeys'] if 'hotkeys' in data else self._get_default_hotkeys()
+            self._saved_payload = raw
 
             logger.info("Configuration loaded successfully.")
             return True
@@ -192,20 +278,35 @@ class ConfigurationManager:
         Returns:
             bool: True if saved successfully, False otherwise.
         """
+        with self._save_lock:
+            self._dirty = False
+            return self._write()
+
+    def _write(self) -> bool:
+        """Write the current configuration to the settings file."""
         try:
-            data = {
-                'app': asdict(self.app),
-                'units': asdict(self.units),
-                'curve_filler': asdict(self.curve_filler),
-                'rhinestone': asdict(self.rhinestone),
-                'batch_processor': asdict(self.batch_processor),
-                'recent_files': self.recent_files[-self.app.recent_files_limit:],
-                'favorite_presets': self.favorite_presets,
-                'hotkeys': self.hotkeys,
+            # Settings sections are mutated in place by callers, so every
+            # write re-serializes all of them; they are small
+            data: Dict[str, Any] = {
+                name: _section_to_dict(getattr(self, name)) for name in _SECTION_ATTRS
             }
-
-            with open(self._config_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Copy the containers so serialization (possibly on the debounce
+            # timer thread) never iterates one the UI thread is changing
+            data['recent_files'] = self.recent_files[:self.app.recent_files_limit]
+            data['favorite_presets'] = list(self.favorite_presets)
+            data['hotkeys'] = dict(self.hotkeys)
+
+            # Serialize fully in memory, then swap the file in atomically so
+            # a crash mid-write cannot leave a truncated settings.json
+            if HAS_ORJSON:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+            if payload == self._saved_payload:
+                logger.debug("Configuration unchanged; skipping write.")
+                return True
+            atomic_write_bytes(self._config_file, payload)
+            self._saved_payload = payload
 
             logger.info("Configuration saved successfully.")
             return True
@@ -214,6 +315,31 @@ class ConfigurationManager:
             logger.error(f"Failed to save configuration: {e}")
             return False
 
+    def schedule_save(self):
+        """
+        Mark the configuration dirty and save it after a short delay.
+
+        Repeated calls within SAVE_DEBOUNCE_SECONDS result in a single write.
+        Pending changes are also flushed at interpreter exit.
+        """
+        with self._save_lock:
+            self._dirty = True
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(SAVE_DEBOUNCE_SECONDS, self.flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+
+    def flush(self) -> bool:
+        """Write pending changes immediately, if any."""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return True
+            self._dirty = False
+            return self._write()
+
     def reset_to_defaults(self):
         """Reset all settings to default values."""
         self.app = AppSettings()
@@ -227,26 +353,32 @@ class ConfigurationManager:
 
     def add_recent_file(self, file_path: str):
         """Add a file to the recent files list."""
-        if file_path in self.recent_files:
-            self.recent_files.remove(file_path)
-        self.recent_files.insert(0, file_path)
-        self.recent_files = self.recent_files[:self.app.recent_files_limit]
-        self.save()
+        with self._save_lock:
+            recent = self._recent_files
+            recent.pop(file_path, None)
+            recent[file_path] = None
+            while len(recent) > self.app.recent_files_limit:
+                del recent[next(iter(recent))]
+            self.schedule_save()
+
+    @property
+    def recent_files(self) -> List[str]:
+        """Recently used files, most recent first."""
+        with self._save_lock:
+            return list(reversed(self._recent_files))
+
+    @recent_files.setter
+    def recent_files(self, files: Iterable[str]):
+        # Deduplicate most-recent-first so a repeated path keeps its newest
+        # position, then store oldest first
+        newest_first = list(dict.fromkeys(files))[:self.app.recent_files_limit]
+        recent = dict.fromkeys(reversed(newest_first))
+        with self._save_lock:
+            self._recent_files = recent
 
     def _get_default_hotkeys(self) -> Dict[str, str]:
         """Get default keyboard shortcuts."""
-        return {
-            'fill_curve': 'Ctrl+F',
-            'preview': 'Ctrl+P',
-            'undo': 'Ctrl+Z',
-            'redo': 'Ctrl+Y',
-            'advanced_fill': 'Ctrl+Shift+F',
-            'save_preset': 'Ctrl+S',
-            'load_preset': 'Ctrl+O',
-            'toggle_preview': 'F5',
-            'randomize': 'Ctrl+R',
-            'settings': 'Ctrl+,',
-        }
+        return dict(_DEFAULT_HOTKEYS)
 
     @property
     def presets_directory(self) -> Path:
@@ -5,11 +5,16 @@ Supports CorelDRAW versions 2018-2024+.
 """
 
 import logging
-from typing import Any, List, Optional, Tuple, Dict
-from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Tuple, Dict
+from dataclasses import dataclass, field
 from enum import Enum
 from contextlib import contextmanager
+from functools import lru_cache
 import math
+import sys
+import threading
+from bisect import bisect_left
+from itertools import accumulate
 
 try:
     import win32com.client
@@ -36,6 +41,11 @@ class NoSelectionError(CorelDRAWError):
     """Raised when no objects are selected."""
     pass
 
+# Geometry records are created in bulk while walking curves; drop the per-instance
+# __dict__ where the interpreter supports slotted dataclasses (3.10+)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
 class ShapeType(Enum):
     """CorelDRAW shape types."""
     CURVE = 1
@@ -51,15 +61,21 @@ class ShapeType(Enum):
     CUSTOM = 11
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class Point:
-    """Represents a 2D point."""
+    """Represents a 2D point. Immutable and hashable, so usable as a dict/set key."""
     x: float
     y: float
 
     def distance_to(self, other: 'Point') -> float:
         """Calculate distance to another point."""
-        return math.sqrt((self.x - other.x) ** 2 + (self.y - other.y) ** 2)
+        return math.hypot(self.x - other.x, self.y - other.y)
+
+    def distance_squared_to(self, other: 'Point') -> float:
+        """Squared distance to another point; cheaper when only comparing distances."""
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return dx * dx + dy * dy
 
     def angle_to(self, other: 'Point') -> float:
         """Calculate angle to another point in degrees."""
@@ -69,7 +85,7 @@ class Point:
         """Convert to tuple."""
         return (self.x, self.y)
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class BoundingBox:
     """Represents a bounding box."""
     left: float
@@ -97,14 +113,25 @@ class BoundingBox:
         return (self.left <= point.x <= self.right and
                 self.bottom <= point.y <= self.top)
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class CurveNode:
     """Represents a node on a curve."""
     position: Point
     type: str = "cusp"
     segment_type: str = "line"  # line, curve
 
-@dataclass
+# Line pieces per Bezier segment when flattening an outline for point tests
+_OUTLINE_FLATTEN_STEPS = 16
+
+# Cubic Bernstein weights at the sample points used to approximate Bezier length
+_BEZIER_LENGTH_STEPS = 20
+_BEZIER_LENGTH_WEIGHTS = tuple(
+    ((1 - t) ** 3, 3 * (1 - t) ** 2 * t, 3 * (1 - t) * t * t, t ** 3)
+    for t in (i / _BEZIER_LENGTH_STEPS for i in range(1, _BEZIER_LENGTH_STEPS + 1))
+)
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class CurveSegment:
     """Represents a segment of a curve."""
     start: Point
@@ -112,6 +139,8 @@ class CurveSegment:
     control1: Optional[Point] = None
     control2: Optional[Point] = None
     is_bezier: bool = False
+    # Cached result of the length property; segments are not mutated after creation
+    _length: Optional[float] = field(default=None, init=False, repr=False, compare=False)
 
     def get_point_at_t(self, t: float) -> Point:
         """
@@ -155,22 +184,50 @@ class CurveSegment:
 
     @property
     def length(self) -> float:
-        """Approximate segment length."""
-        if not self.is_bezier:
+        """Approximate segment length (computed once, then cached)."""
+        if self._length is None:
+            self._length = self._compute_length()
+        return self._length
+
+    def _compute_length(self) -> float:
+        """Compute the segment length, sampling Bezier segments."""
+        if not self.is_bezier or not self.control1 or not self.control2:
             return self.start.distance_to(self.end)
 
-        # Approximate with multiple samples
+        # Approximate with a polyline through precomputed sample points,
+        # working on plain floats rather than allocating a Point per sample
+        x0, y0 = self.start.x, self.start.y
+        x1, y1 = self.control1.x, self.control1.y
+        x2, y2 = self.control2.x, self.control2.y
+        x3, y3 = self.end.x, self.end.y
+        hypot = math.hypot
         total = 0.0
-        steps = 20
-        prev = self.start
-        for i in range(1, steps + 1):
-            t = i / steps
-            curr = self.get_point_at_t(t)
-            total += prev.distance_to(curr)
-            prev = curr
+        prev_x, prev_y = x0, y0
+        for b0, b1, b2, b3 in _BEZIER_LENGTH_WEIGHTS:
+            x = b0 * x0 + b1 * x1 + b2 * x2 + b3 * x3
+            y = b0 * y0 + b1 * y1 + b2 * y2 + b3 * y3
+            total += hypot(x - prev_x, y - prev_y)
+            prev_x, prev_y = x, y
         return total
 
 
+class CurvePath(list):
+    """
+    List of CurveSegment objects with per-segment lengths computed once.
+
+    Behaves exactly like a list of segments, so existing callers can iterate
+    and index it; length queries read the precomputed values instead of
+    re-sampling every Bezier segment on each call. Treat it as read-only.
+    """
+
+    def __init__(self, segments=()):
+        super().__init__(segments)
+        self.lengths: List[float] = [seg.length for seg in self]
+        # cumulative_lengths[i] is the distance from the path start to the end of segment i
+        self.cumulative_lengths: List[float] = list(accumulate(self.lengths))
+        self.total_length: float = self.cumulative_lengths[-1] if self else 0.0
+
+
 class CorelDRAWInterface:
     """
     Main interface for CorelDRAW COM automation.
@@ -185,11 +242,25 @@ class CorelDRAWInterface:
                 "Install with: pip install pywin32"
             )
 
-        self._app = None
+        self._main_app = None
+        self._prog_id = None
+        # Per-thread application proxies, see thread_apartment()
+        self._thread_state = threading.local()
         self._connected = False
         self._version = None
         logger.info("CorelDRAW interface initialized.")
 
+    @property
+    def _app(self):
+        # A COM proxy only works in the apartment that created it, so worker
+        # threads inside thread_apartment() get their own
+        app = getattr(self._thread_state, "app", None)
+        return app if app is not None else self._main_app
+
+    @_app.setter
+    def _app(self, value):
+        self._main_app = value
+
     def connect(self) -> bool:
         """
         Connect to a running CorelDRAW instance.
@@ -216,7 +287,8 @@ class CorelDRAWInterface:
         
         # Try generic "CorelDRAW.Application" first (works for any recent version)
         try:
-            self._app = win32com.client.Dispatch("CorelDRAW.Application")
+            self._app = self._dispatch("CorelDRAW.Application")
+            self._prog_id = "CorelDRAW.Application"
             self._connected = True
             self._version = self._get_version()
             logger.info(f"Connected to CorelDRAW {self._version}")
@@ -227,7 +299,8 @@ class CorelDRAWInterface:
         # Fall back to version-specific CLSIDs
         for clsid in clsids:
             try:
-                self._app = win32com.client.Dispatch(clsid)
+                self._app = self._dispatch(clsid)
+                self._prog_id = clsid
                 self._connected = True
                 self._version = self._get_version()
                 logger.info(f"Connected to CorelDRAW {self._version}")
@@ -238,16 +311,59 @@ class CorelDRAWInterface:
         self._connected = False
         raise CorelDRAWConnectionError("Could not connect to any CorelDRAW version (2018-2024)")
 
+    @staticmethod
+    def _dispatch(prog_id: str):
+        """
+        Get an early-bound dispatch for prog_id.
+
+        gencache wrappers call through the type library's vtable instead of
+        resolving every property name via IDispatch::Invoke. Falls back to
+        late binding when the wrapper cannot be generated (e.g. read-only
+        gen_py cache in a frozen build).
+        """
+        try:
+            return win32com.client.gencache.EnsureDispatch(prog_id)
+        except Exception as e:
+            logger.debug(f"Early binding unavailable for {prog_id}: {e}")
+            return win32com.client.Dispatch(prog_id)
+
     def disconnect(self):
         """Disconnect from CorelDRAW."""
         self._app = None
+        self._prog_id = None
         self._connected = False
+        self._version = None
         try:
             pythoncom.CoUninitialize()
         except:
             pass
         logger.info("Disconnected from CorelDRAW.")
 
+    @contextmanager
+    def thread_apartment(self):
+        """
+        Use CorelDRAW from a worker thread.
+
+        Initializes COM on the calling thread and dispatches a proxy to the
+        running CorelDRAW instance for it. Inside the block every method of
+        this interface called from that thread goes through the new proxy;
+        other threads keep using the one created by connect().
+
+        Usage:
+            with corel.thread_apartment():
+                corel.app.OpenDocument(path)
+        """
+        if not self.is_connected:
+            raise CorelDRAWConnectionError("Not connected to CorelDRAW.")
+
+        pythoncom.CoInitialize()
+        try:
+            self._thread_state.app = self._dispatch(self._prog_id)
+            yield self._thread_state.app
+        finally:
+            self._thread_state.app = None
+            pythoncom.CoUninitialize()
+
     def _get_version(self) -> str:
         """Get CorelDRAW version string."""
         try:
@@ -314,10 +430,12 @@ class CorelDRAWInterface:
         """
         self.ensure_document()
         try:
+            # Each attribute access is a COM call; fetch the Shapes range once
             sel = self._app.ActiveSelection
-            if sel is None or sel.Shapes is None or sel.Shapes.Count == 0:
+            shapes = sel.Shapes if sel is not None else None
+            if shapes is None or shapes.Count == 0:
                 raise NoSelectionError("No objects are selected.")
-            return sel.Shapes
+            return shapes
         except Exception as e:
             logger.error(f"Error getting selection: {e}")
             raise NoSelectionError(f"Could not get selection: {e}")
@@ -331,12 +449,10 @@ class CorelDRAWInterface:
 
     def begin_command_group(self, name: str = "Automation"):
         """Begin a command group for undo support."""
-        self.ensure_document()
         self.active_document.BeginCommandGroup(name)
 
     def end_command_group(self):
         """End the current command group."""
-        self.ensure_document()
         self.active_document.EndCommandGroup()
 
     def get_shape_bounds(self, shape) -> BoundingBox:
@@ -397,7 +513,7 @@ class CorelDRAWInterface:
             scale_y = scale_x
         shape.Stretch(scale_x, scale_y)
 
-    def get_curve_path(self, shape) -> List[CurveSegment]:
+    def get_curve_path(self, shape) -> CurvePath:
         """
         Extract path data from a curve shape.
 
@@ -405,7 +521,7 @@ class CorelDRAWInterface:
             shape: The curve shape to extract path from.
 
         Returns:
-            List of CurveSegment objects describing the path.
+            CurvePath (list of CurveSegment objects) describing the path.
         """
         segments = []
 
@@ -417,48 +533,69 @@ class CorelDRAWInterface:
             curve = shape.Curve
             if curve is None:
                 logger.warning("Shape has no curve data.")
-                return segments
-
-            # Iterate through subpaths
-            for subpath_idx in range(1, curve.SubPaths.Count + 1):
-                subpath = curve.SubPaths.Item(subpath_idx)
+                return CurvePath()
 
-                # Iterate through segments
-                for seg_idx in range(1, subpath.Segments.Count + 1):
-                    seg = subpath.Segments.Item(seg_idx)
-                    start_node = seg.StartNode
-                    start_point = Point(start_node.PositionX, start_node.PositionY)
-                    end_node = seg.EndNode
-                    end_point = Point(end_node.PositionX, end_node.PositionY)
-                    is_bezier = seg.Type == 2  # cdrCurveSegment
-                    control1 = None
-                    control2 = None
-
-                    if is_bezier:
-                        try:
-                            ctrl1_x = start_node.PositionX + seg.StartingControlPointOffset[0]
-                            ctrl1_y = start_node.PositionY + seg.StartingControlPointOffset[1]
-                            control1 = Point(ctrl1_x, ctrl1_y)
-
-                            ctrl2_x = end_node.PositionX + seg.EndingControlPointOffset[0]
-                            ctrl2_y = end_node.PositionY + seg.EndingControlPointOffset[1]
-                            control2 = Point(ctrl2_x, ctrl2_y)
-                        except:
-                            is_bezier = False
-                    segment = CurveSegment(
-                        start=start_point,
-                        end=end_point,
-                        control1=control1,
-                        control2=control2,
-                        is_bezier=is_bezier
-                    )
-                    segments.append(segment)
+            self._read_curve_segments(curve, segments)
         except Exception as e:
             logger.error(f"Error extracting curve path: {e}")
-        return segments
+        return CurvePath(segments)
+
+    def _read_curve_segments(self, curve, segments: List[CurveSegment],
+                             subpath_starts: Optional[List[int]] = None):
+        """
+        Append a CurveSegment to segments for every segment of a COM Curve.
+
+        If subpath_starts is given, the index in segments where each subpath
+        begins is appended to it.
+        """
+        # Every property read below is a COM round-trip, so each value
+        # is fetched once and kept in a local. Hot callables are bound to
+        # locals too, since long curves run this loop thousands of times.
+        make_point = Point
+        make_segment = CurveSegment
+        append = segments.append
+        subpaths = curve.SubPaths
+        get_subpath = subpaths.Item
+        for subpath_idx in range(1, subpaths.Count + 1):
+            subpath_segments = get_subpath(subpath_idx).Segments
+            get_segment = subpath_segments.Item
+            if subpath_starts is not None:
+                subpath_starts.append(len(segments))
+
+            # Within a subpath each segment starts at the previous segment's
+            # end node, so only the first start node needs to be read
+            start_point = None
+            for seg_idx in range(1, subpath_segments.Count + 1):
+                seg = get_segment(seg_idx)
+                if start_point is None:
+                    start_node = seg.StartNode
+                    start_point = make_point(start_node.PositionX, start_node.PositionY)
+                end_node = seg.EndNode
+                end_x = end_node.PositionX
+                end_y = end_node.PositionY
+                end_point = make_point(end_x, end_y)
+
+                if seg.Type == 2:  # cdrCurveSegment
+                    try:
+                        start_offset = seg.StartingControlPointOffset
+                        end_offset = seg.EndingControlPointOffset
+                        append(make_segment(
+                            start_point,
+                            end_point,
+                            make_point(start_point.x + start_offset[0], start_point.y + start_offset[1]),
+                            make_point(end_x + end_offset[0], end_y + end_offset[1]),
+                            True
+                        ))
+                    except:
+                        append(make_segment(start_point, end_point))
+                else:
+                    append(make_segment(start_point, end_point))
+                start_point = end_point
 
     def get_curve_total_length(self, segments: List[CurveSegment]) -> float:
         """Calculate total length of curve from segments."""
+        if isinstance(segments, CurvePath):
+            return segments.total_length
         return sum(seg.length for seg in segments)
 
     def get_point_on_curve(self, segments: List[CurveSegment], distance: float) -> Tuple[Point, float]:
@@ -472,18 +609,18 @@ class CorelDRAWInterface:
         Returns:
             Tuple of (Point, tangent_angle).
         """
-        current_dist = 0.0
-
-        for seg in segments:
-            seg_len = seg.length
-            if current_dist + seg_len >= distance:
-                # Point is in this segment
-                remaining = distance - current_dist
-                t = remaining / seg_len if seg_len > 0 else 0
-                point = seg.get_point_at_t(t)
-                angle = seg.get_tangent_at_t(t)
-                return (point, angle)
-            current_dist += seg_len
+        path = segments if isinstance(segments, CurvePath) else CurvePath(segments)
+
+        # First segment whose end lies at or beyond the requested distance
+        index = bisect_left(path.cumulative_lengths, distance)
+        if index < len(path):
+            seg = path[index]
+            seg_len = path.lengths[index]
+            remaining = distance - (path.cumulative_lengths[index - 1] if index else 0.0)
+            t = remaining / seg_len if seg_len > 0 else 0
+            point = seg.get_point_at_t(t)
+            angle = seg.get_tangent_at_t(t)
+            return (point, angle)
 
         # If distance exceeds curve length, return end point
         if segments:
@@ -492,6 +629,56 @@ class CorelDRAWInterface:
 
         return (Point(0, 0), 0.0)
 
+    def get_points_on_curve(self, segments: List[CurveSegment],
+                            distances: List[float]) -> List[Tuple[Point, float]]:
+        """
+        Get points and tangent angles at many distances along a curve.
+
+        Gives the same results as calling get_point_on_curve() for each
+        distance. Ascending distances, the usual case, are located by walking
+        the cumulative length table forward rather than by a binary search
+        each, so a whole fill costs O(N + S) instead of O(N log S).
+
+        Args:
+            segments: List of curve segments.
+            distances: Distances along the curve.
+
+        Returns:
+            List of (Point, tangent_angle) tuples, one per distance.
+        """
+        path = segments if isinstance(segments, CurvePath) else CurvePath(segments)
+        if not path:
+            return [(Point(0, 0), 0.0) for _ in distances]
+
+        cumulative = path.cumulative_lengths
+        lengths = path.lengths
+        count = len(path)
+        last_seg = path[-1]
+        results = []
+        append = results.append
+        index = 0
+        previous = -math.inf
+
+        for distance in distances:
+            if distance < previous:
+                index = bisect_left(cumulative, distance)
+            else:
+                # Same index bisect_left would find, searching forward only
+                while index < count and cumulative[index] < distance:
+                    index += 1
+            previous = distance
+
+            if index < count:
+                seg = path[index]
+                seg_len = lengths[index]
+                remaining = distance - (cumulative[index - 1] if index else 0.0)
+                t = remaining / seg_len if seg_len > 0 else 0
+                append((seg.get_point_at_t(t), seg.get_tangent_at_t(t)))
+            else:
+                append((last_seg.end, last_seg.get_tangent_at_t(1.0)))
+
+        return results
+
     def is_point_inside_shape(self, shape, point: Point) -> bool:
         """
         Check if a point is inside a closed shape.
@@ -619,4 +806,85 @@ class CorelDRAWInterface:
         except Exception as e:
             logger.debug(f"Point check error: {e}")
             return True
-corel = CorelDRAWInterface()
+
+    def point_in_shape_tester(self, shape=None) -> Callable[[float, float], bool]:
+        """
+        Build a point-in-shape predicate for repeated tests against one shape.
+
+        The outline is read from CorelDRAW once and flattened into a polygon,
+        so each test is an even-odd ray cast in Python instead of one or more
+        COM calls (and a temporary shape) per point. Each open subpath is
+        closed with a straight edge back to its start, as CorelDRAW does when
+        filling open curves. Falls back to is_point_in_shape if the outline
+        cannot be read.
+
+        Args:
+            shape: Shape to test against (optional, uses selection if not provided).
+        Returns:
+            Callable taking (x, y) and returning True if the point is inside.
+        """
+        try:
+            if shape is None:
+                selection = self.get_selection()
+                if selection.Count == 0:
+                    return lambda x, y: True
+                shape = selection.Item(1)
+            segments: List[CurveSegment] = []
+            subpath_starts: List[int] = []
+            # DisplayCurve reads the outline of any shape without converting it
+            self._read_curve_segments(shape.DisplayCurve, segments, subpath_starts)
+        except Exception as e:
+            logger.debug(f"Outline read error: {e}")
+            segments = []
+
+        if not segments:
+            return lambda x, y: self.is_point_in_shape(x, y, shape)
+
+        edges = []
+        for begin, end in zip(subpath_starts, subpath_starts[1:] + [len(segments)]):
+            if begin == end:
+                continue
+            # Flatten the subpath into one polyline
+            points = [segments[begin].start]
+            for seg in segments[begin:end]:
+                if seg.is_bezier:
+                    points.extend(seg.get_point_at_t(i / _OUTLINE_FLATTEN_STEPS)
+                                  for i in range(1, _OUTLINE_FLATTEN_STEPS + 1))
+                else:
+                    points.append(seg.end)
+            first, last = points[0], points[-1]
+            if (first.x, first.y) != (last.x, last.y):
+                points.append(first)
+            for p1, p2 in zip(points, points[1:]):
+                if p1.y != p2.y:
+                    edges.append((p1.x, p1.y, p2.x, p2.y))
+
+        xs = [e[0] for e in edges] + [e[2] for e in edges]
+        ys = [e[1] for e in edges] + [e[3] for e in edges]
+        min_x, max_x = min(xs, default=0.0), max(xs, default=0.0)
+        min_y, max_y = min(ys, default=0.0), max(ys, default=0.0)
+
+        def contains(x: float, y: float) -> bool:
+            if x < min_x or x > max_x or y < min_y or y > max_y:
+                return False
+            inside = False
+            for x1, y1, x2, y2 in edges:
+                if (y1 > y) != (y2 > y) and x < x1 + (y - y1) * (x2 - x1) / (y2 - y1):
+                    inside = not inside
+            return inside
+
+        return contains
+
+
+@lru_cache(maxsize=None)
+def get_corel() -> CorelDRAWInterface:
+    """Get the shared CorelDRAWInterface, creating it on first use."""
+    return CorelDRAWInterface()
+
+
+def __getattr__(name: str):
+    # Build the global `corel` instance lazily (PEP 562) so importing the
+    # geometry types does not require pywin32
+    if name == 'corel':
+        return get_corel()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
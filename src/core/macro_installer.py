@@ -4,15 +4,25 @@ Copies bundled macros into CorelDRAW macro folders.
 """
 
 import hashlib
+import json
 import logging
 import os
-import sys
+import shutil
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional
+
+from ..utils.resources import get_resource_root
 
 logger = logging.getLogger(__name__)
 
+# Per-file digest cache kept in the config cache directory, keyed by
+# lower-cased file name: [size, mtime_ns, sha256 hex]
+_DIGEST_CACHE_NAME = "macro_digests.json"
+_HASH_CHUNK_SIZE = 1 << 16
+
 
 @dataclass
 class MacroInstallResult:
@@ -23,75 +33,156 @@ class MacroInstallResult:
     reason: str
 
 
-def _get_resource_root() -> Path:
-    if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
-        return Path(sys._MEIPASS)
-    return Path(__file__).resolve().parents[1]
-
-
 def _get_macro_source_dir() -> Optional[Path]:
     override = os.environ.get("CDAT_MACRO_SOURCE")
     if override:
         p = Path(override)
         return p if p.exists() else None
-    resources_root = _get_resource_root()
+    resources_root = get_resource_root()
     candidate = resources_root / "resources" / "macros"
     return candidate if candidate.exists() else None
 
 
-def _hash_macro_files(files: Iterable[Path]) -> str:
+def _load_digest_cache(cache_file: Optional[Path]) -> Dict[str, list]:
+    if cache_file is None:
+        return {}
+    try:
+        data = json.loads(cache_file.read_text(encoding="utf-8"))
+        return data if isinstance(data, dict) else {}
+    except Exception:
+        return {}
+
+
+def _save_digest_cache(cache_file: Optional[Path], digests: Dict[str, list]):
+    if cache_file is None:
+        return
+    try:
+        cache_file.write_text(json.dumps(digests), encoding="utf-8")
+    except Exception as e:
+        logger.debug(f"Failed to write macro digest cache: {e}")
+
+
+def _file_sha256(path: Path) -> str:
+    # Fixed-size chunks keep memory flat regardless of macro size
     h = hashlib.sha256()
-    for path in sorted(files):
-        h.update(path.name.lower().encode("utf-8"))
-        try:
-            h.update(path.read_bytes())
-        except Exception:
-            continue
+    with open(path, "rb", buffering=0) as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            h.update(chunk)
     return h.hexdigest()
 
 
-def _iter_corel_macro_dirs(root: Path, max_depth: int = 5) -> Iterable[Path]:
-    if not root.exists():
-        return []
-    results = []
-    root = root.resolve()
-    root_depth = len(root.parts)
-    for current, dirs, _files in os.walk(root):
-        depth = len(Path(current).parts) - root_depth
-        if depth > max_depth:
-            dirs[:] = []
+def _try_file_sha256(path: Path) -> Optional[str]:
+    try:
+        return _file_sha256(path)
+    except Exception:
+        return None
+
+
+def _hash_macro_files(files: Iterable[Path], digest_cache: Optional[Dict[str, list]] = None) -> str:
+    """
+    Combined hash of the macro files' names and contents.
+
+    When digest_cache is given, files whose size and mtime match the cached
+    entry reuse the stored digest instead of being read again; the cache is
+    updated in place to describe exactly the given files. Set
+    CDAT_MACRO_REHASH_ALL=1 to ignore cached digests.
+    """
+    reuse = digest_cache is not None and os.environ.get("CDAT_MACRO_REHASH_ALL") != "1"
+    fresh: Dict[str, list] = {}
+    stale = []
+    names = []
+    for path in sorted(files):
+        name = path.name.lower()
+        names.append(name)
+        try:
+            st = os.stat(path)
+        except OSError:
             continue
-        if Path(current).name.lower() == "gms":
-            results.append(Path(current))
+        cached = digest_cache.get(name) if reuse else None
+        if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+            fresh[name] = cached
+        else:
+            stale.append((name, path, st))
+
+    # sha256 releases the GIL while hashing, so files are read and hashed
+    # in parallel; the result order is fixed by the sorted names below
+    if stale:
+        with ThreadPoolExecutor(max_workers=min(8, len(stale))) as pool:
+            digests = pool.map(_try_file_sha256, [path for _name, path, _st in stale])
+            for (name, _path, st), digest in zip(stale, digests):
+                if digest is not None:
+                    fresh[name] = [st.st_size, st.st_mtime_ns, digest]
+
+    entries = [f"{name}:{fresh[name][2]}" if name in fresh else name for name in names]
+    if digest_cache is not None:
+        digest_cache.clear()
+        digest_cache.update(fresh)
+    return hashlib.sha256("\n".join(entries).encode("utf-8")).hexdigest()
+
+
+def _walk_gms_dirs(root: str, max_depth: int = 5) -> List[str]:
+    """Return path strings of all "gms" folders at most max_depth below root."""
+    results = []
+    if os.path.basename(root).lower() == "gms":
+        results.append(root)
+
+    # scandir entries carry the directory flag from the listing itself, so
+    # classifying children needs no extra stat() per entry
+    def _walk(dir_path: str, depth: int):
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError:
+            return
+        for entry in entries:
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            if entry.name.lower() == "gms":
+                results.append(entry.path)
+            if depth < max_depth:
+                _walk(entry.path, depth + 1)
+
+    _walk(root, 1)
     return results
 
 
+def _resolve_if_exists(path: str) -> Optional[str]:
+    """Resolved path if path is an existing directory, else None (one stat)."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if not stat.S_ISDIR(st.st_mode):
+        return None
+    return os.path.realpath(path)
+
+
 def _find_corel_macro_dirs() -> List[Path]:
-    roots = []
+    # Candidate roots are plain strings; missing or repeated ones (env vars
+    # can point into the same tree) are skipped before any walk starts
+    candidate_roots = []
     for env_name in ("APPDATA", "LOCALAPPDATA", "PROGRAMDATA"):
         env_val = os.environ.get(env_name)
         if env_val:
-            roots.append(Path(env_val))
-
-    candidate_roots = []
-    for base in roots:
-        candidate_roots.append(base / "Corel")
-        candidate_roots.append(base / "Corel Corporation")
-        candidate_roots.append(base / "CorelDRAW")
+            for sub in ("Corel", "Corel Corporation", "CorelDRAW"):
+                candidate_roots.append(os.path.join(env_val, sub))
 
-    macro_dirs = []
-    for root in candidate_roots:
-        macro_dirs.extend(_iter_corel_macro_dirs(root))
-
-    # Deduplicate while preserving order
+    # Walk and deduplicate on plain strings, preserving order; Path objects
+    # are only built for the folders returned
+    seen_roots = set()
     seen = set()
     unique = []
-    for d in macro_dirs:
-        key = str(d).lower()
-        if key in seen:
+    for root in candidate_roots:
+        root = _resolve_if_exists(root)
+        if root is None or root.lower() in seen_roots:
             continue
-        seen.add(key)
-        unique.append(d)
+        seen_roots.add(root.lower())
+        for d in _walk_gms_dirs(root):
+            key = d.lower()
+            if key in seen:
+                continue
+            seen.add(key)
+            unique.append(Path(d))
     return unique
 
 
@@ -104,11 +195,19 @@ def install_macros_if_needed(config) -> MacroInstallResult:
     if not source_dir:
         return MacroInstallResult(0, [], None, True, "no_source_dir")
 
-    macro_files = list(source_dir.glob("*.gms"))
+    with os.scandir(source_dir) as it:
+        macro_files = [Path(e.path) for e in it
+                       if e.name.lower().endswith(".gms") and e.is_file(follow_symlinks=False)]
     if not macro_files:
         return MacroInstallResult(0, [], source_dir, True, "no_macros_found")
 
-    current_hash = _hash_macro_files(macro_files)
+    cache_dir = getattr(config, "cache_directory", None)
+    digest_file = Path(cache_dir) / _DIGEST_CACHE_NAME if cache_dir else None
+    digests = _load_digest_cache(digest_file)
+    previous_digests = dict(digests)
+    current_hash = _hash_macro_files(macro_files, digests)
+    if digests != previous_digests:
+        _save_digest_cache(digest_file, digests)
     if getattr(config.app, "macros_installed_hash", "") == current_hash:
         return MacroInstallResult(0, [], source_dir, True, "already_installed")
 
@@ -121,8 +220,8 @@ def install_macros_if_needed(config) -> MacroInstallResult:
         try:
             target.mkdir(parents=True, exist_ok=True)
             for macro in macro_files:
-                dest = target / macro.name
-                dest.write_bytes(macro.read_bytes())
+                # copyfile uses the platform fast path (sendfile / CopyFile)
+                shutil.copyfile(macro, target / macro.name)
                 installed_count += 1
         except Exception as e:
             logger.warning(f"Failed to install macros to {target}: {e}")
@@ -5,13 +5,23 @@ Handles saving, loading, importing, and exporting of tool presets.
 
 import json
 import logging
-from pathlib import Path
-from typing import Any, Dict, List, Optional
-from datetime import datetime
+import os
+import re
+from bisect import bisect_left, insort
 from dataclasses import dataclass, asdict
-import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None
 
 from ..config import config
+from ..utils.file_utils import atomic_write_bytes
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +42,54 @@ class PresetMetadata:
     is_favorite: bool = False
 
 
+# Characters replaced by '_' in preset file names; \w is exactly
+# str.isalnum() plus '_', so this matches the old per-character filter
+_UNSAFE_NAME_CHARS = re.compile(r'[^\w-]')
+
+# Suffix of the metadata header written next to each preset file
+_META_SUFFIX = '.meta.json'
+
+
+def _meta_path(preset_path: Path) -> Path:
+    """Path of the metadata header for a preset file."""
+    return preset_path.with_suffix(_META_SUFFIX)
+
+
+def _json_load(path) -> Any:
+    """Read and parse a JSON file, using orjson when available."""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if HAS_ORJSON else json.loads(raw.decode('utf-8'))
+
+
+def _json_dump(path, data: Any):
+    """
+    Write data to a JSON file as indented UTF-8, using orjson when available.
+
+    The file is replaced atomically, so readers never see a partially
+    written preset.
+    """
+    if HAS_ORJSON:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    atomic_write_bytes(path, payload)
+
+
+def _scan_json(path: str) -> Iterator[str]:
+    """Yield paths of all .json files below path, using scandir's cached file types."""
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _scan_json(entry.path)
+        elif entry.name.endswith('.json') and entry.is_file(follow_symlinks=False):
+            yield entry.path
+
+
 class PresetManager:
     """
     Manages presets for all tools in the application.
@@ -43,6 +101,13 @@ class PresetManager:
         self._presets_dir = config.presets_directory
         self._ensure_directories()
         self._cache: Dict[str, Dict] = {}
+        # Secondary indexes over the cache, kept in step by _index/_unindex.
+        # Each holds (name, preset_id) keys kept sorted, so getters return
+        # presets in name order without sorting on every call.
+        self._by_name: List[Tuple[str, str]] = []
+        self._by_tool: Dict[str, List[Tuple[str, str]]] = {}
+        self._by_category: Dict[str, List[Tuple[str, str]]] = {}
+        self._favorites: List[Tuple[str, str]] = []
         self._loaded = False
         if not defer_load:
             self._load_cache()
@@ -61,19 +126,86 @@ class PresetManager:
         for cat in categories:
             (self._presets_dir / cat).mkdir(parents=True, exist_ok=True)
 
+    def _index(self, preset_id: str):
+        """Add a cached preset to the secondary indexes."""
+        info = self._cache[preset_id]
+        metadata = info['metadata']
+        # Hand-edited files may hold non-string values; coerce them so the
+        # lower-casing and the sorted index comparisons cannot raise
+        name = str(metadata.get('name', ''))
+        # Lower-cased search fields, so search_presets does no per-query case folding
+        name_lc = name.lower()
+        desc_lc = str(metadata.get('description', '')).lower()
+        tags_lc = '\0'.join(str(tag) for tag in metadata.get('tags') or ()).lower()
+        # Look up every index list before inserting, so a failure leaves
+        # the indexes untouched
+        by_tool = self._by_tool.setdefault(metadata.get('tool'), [])
+        by_category = self._by_category.setdefault(metadata.get('category'), [])
+        key = (name, preset_id)
+        info['_name_lc'] = name_lc
+        info['_desc_lc'] = desc_lc
+        info['_tags_lc'] = tags_lc
+        info['_order_key'] = key
+        insort(self._by_name, key)
+        insort(by_tool, key)
+        insort(by_category, key)
+        if metadata.get('is_favorite', False):
+            insort(self._favorites, key)
+
+    def _unindex(self, preset_id: str):
+        """Remove a cached preset from the secondary indexes."""
+        info = self._cache[preset_id]
+        metadata = info['metadata']
+        key = info.get('_order_key')
+        if key is None:
+            return
+        for keys in (self._by_name,
+                     self._by_tool.get(metadata.get('tool'), []),
+                     self._by_category.get(metadata.get('category'), []),
+                     self._favorites):
+            i = bisect_left(keys, key)
+            if i < len(keys) and keys[i] == key:
+                del keys[i]
+
+    def _rows(self, keys: Iterable[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """Build result rows for sorted (name, preset_id) index keys."""
+        cache = self._cache
+        return [{'id': preset_id, **cache[preset_id]['metadata']} for _name, preset_id in keys]
+
     def _load_cache(self):
         """Load preset metadata into cache."""
         self._cache.clear()
-        for preset_file in self._presets_dir.rglob("*.json"):
+        self._by_name.clear()
+        self._by_tool.clear()
+        self._by_category.clear()
+        self._favorites.clear()
+        files = list(_scan_json(str(self._presets_dir)))
+        meta_files = {f for f in files if f.endswith(_META_SUFFIX)}
+        for preset_file in files:
+            if preset_file in meta_files:
+                continue
             try:
-                with open(preset_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if 'metadata' in data:
-                        preset_id = data['metadata'].get('id', preset_file.stem)
-                        self._cache[preset_id] = {
-                            'path': preset_file,
-                            'metadata': data['metadata']
-                        }
+                # Read the small metadata header when present so the
+                # settings payload is not parsed just to build the index
+                meta_file = preset_file[:-len('.json')] + _META_SUFFIX
+                if meta_file in meta_files:
+                    metadata = _json_load(meta_file)
+                else:
+                    metadata = _json_load(preset_file).get('metadata')
+                if metadata is not None:
+                    preset_path = Path(preset_file)
+                    preset_id = metadata.get('id', preset_path.stem)
+                    if preset_id in self._cache:
+                        self._unindex(preset_id)
+                    self._cache[preset_id] = {
+                        'path': preset_path,
+                        'metadata': metadata
+                    }
+                    try:
+                        self._index(preset_id)
+                    except Exception:
+                        self._cache.pop(preset_id, None)
+                        raise
             except Exception as e:
                 logger.warning(f"Failed to load preset {preset_file}: {e}")
 
@@ -96,7 +228,9 @@ class PresetManager:
             str: Preset ID.
         """
         self._ensure_loaded()
-        preset_id = str(uuid.uuid4())[:8]
+        preset_id = os.urandom(4).hex()
+        while preset_id in self._cache:
+            preset_id = os.urandom(4).hex()
         now = datetime.now().isoformat()
 
         metadata = PresetMetadata(
@@ -117,15 +251,16 @@ class PresetManager:
             'metadata': asdict(metadata),
             'settings': settings
         }
-        safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in name)
+        safe_name = _UNSAFE_NAME_CHARS.sub('_', name)
         preset_file = self._presets_dir / category / f"{safe_name}_{preset_id}.json"
         try:
-            with open(preset_file, 'w', encoding='utf-8') as f:
-                json.dump(preset_data, f, indent=2, ensure_ascii=False)
+            _json_dump(preset_file, preset_data)
+            _json_dump(_meta_path(preset_file), preset_data['metadata'])
             self._cache[preset_id] = {
                 'path': preset_file,
                 'metadata': asdict(metadata)
             }
+            self._index(preset_id)
 
             logger.info(f"Preset saved: {name} (ID: {preset_id})")
             return preset_id
@@ -144,10 +279,13 @@ class PresetManager:
         if preset_id not in self._cache:
             logger.warning(f"Preset not found: {preset_id}")
             return None
-        preset_path = self._cache[preset_id]['path']
+        info = self._cache[preset_id]
         try:
-            with open(preset_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            preset_data = _json_load(info['path'])
+            # The metadata header is authoritative; metadata-only updates
+            # do not rewrite the full preset file
+            preset_data['metadata'] = dict(info['metadata'])
+            return preset_data
         except Exception as e:
             logger.error(f"Failed to load preset {preset_id}: {e}")
             return None
@@ -156,6 +294,9 @@ class PresetManager:
         """
         Update an existing preset.
 
+        Metadata-only updates (e.g. toggling a favorite) rewrite just the
+        metadata header, not the settings payload.
+
         Args:
             preset_id: The preset ID.
             settings: New settings (optional).
@@ -165,24 +306,26 @@ class PresetManager:
             bool: True if successful.
         """
         self._ensure_loaded()
-        preset_data = self.load_preset(preset_id)
-        if not preset_data:
+        info = self._cache.get(preset_id)
+        if info is None:
+            logger.warning(f"Preset not found: {preset_id}")
             return False
 
-        if settings:
-            preset_data['settings'] = settings
-
+        metadata = dict(info['metadata'])
         if metadata_updates:
-            preset_data['metadata'].update(metadata_updates)
+            metadata.update(metadata_updates)
 
-        preset_data['metadata']['modified'] = datetime.now().isoformat()
+        metadata['modified'] = datetime.now().isoformat()
 
         try:
-            preset_path = self._cache[preset_id]['path']
-            with open(preset_path, 'w', encoding='utf-8') as f:
-                json.dump(preset_data, f, indent=2, ensure_ascii=False)
-
-            self._cache[preset_id]['metadata'] = preset_data['metadata']
+            preset_path = info['path']
+            if settings:
+                _json_dump(preset_path, {'metadata': metadata, 'settings': settings})
+            _json_dump(_meta_path(preset_path), metadata)
+
+            self._unindex(preset_id)
+            info['metadata'] = metadata
+            self._index(preset_id)
             logger.info(f"Preset updated: {preset_id}")
             return True
 
@@ -207,6 +350,8 @@ class PresetManager:
         try:
             preset_path = self._cache[preset_id]['path']
             preset_path.unlink()
+            _meta_path(preset_path).unlink(missing_ok=True)
+            self._unindex(preset_id)
             del self._cache[preset_id]
             logger.info(f"Preset deleted: {preset_id}")
             return True
@@ -217,38 +362,17 @@ class PresetManager:
     def get_presets_by_tool(self, tool: str) -> List[Dict[str, Any]]:
         """Get all presets for a specific tool."""
         self._ensure_loaded()
-        result = []
-        for preset_id, info in self._cache.items():
-            if info['metadata'].get('tool') == tool:
-                result.append({
-                    'id': preset_id,
-                    **info['metadata']
-                })
-        return sorted(result, key=lambda x: x.get('name', ''))
+        return self._rows(self._by_tool.get(tool, ()))
 
     def get_presets_by_category(self, category: str) -> List[Dict[str, Any]]:
         """Get all presets in a category."""
         self._ensure_loaded()
-        result = []
-        for preset_id, info in self._cache.items():
-            if info['metadata'].get('category') == category:
-                result.append({
-                    'id': preset_id,
-                    **info['metadata']
-                })
-        return sorted(result, key=lambda x: x.get('name', ''))
+        return self._rows(self._by_category.get(category, ()))
 
     def get_favorites(self) -> List[Dict[str, Any]]:
         """Get all favorite presets."""
         self._ensure_loaded()
-        result = []
-        for preset_id, info in self._cache.items():
-            if info['metadata'].get('is_favorite', False):
-                result.append({
-                    'id': preset_id,
-                    **info['metadata']
-                })
-        return sorted(result, key=lambda x: x.get('name', ''))
+        return self._rows(self._favorites)
 
     def toggle_favorite(self, preset_id: str) -> bool:
         """Toggle favorite status of a preset."""
@@ -273,25 +397,20 @@ class PresetManager:
         self._ensure_loaded()
         query_lower = query.lower()
         result = []
+        keys = self._by_tool.get(tool, ()) if tool else self._by_name
 
-        for preset_id, info in self._cache.items():
-            metadata = info['metadata']
-
-            if tool and metadata.get('tool') != tool:
-                continue
+        for _name, preset_id in keys:
+            info = self._cache[preset_id]
 
             # Search in name, description, and tags
-            name_match = query_lower in metadata.get('name', '').lower()
-            desc_match = query_lower in metadata.get('description', '').lower()
-            tags = metadata.get('tags', [])
-            tag_match = any(query_lower in tag.lower() for tag in tags)
-
-            if name_match or desc_match or tag_match:
+            if (query_lower in info['_name_lc'] or
+                    query_lower in info['_desc_lc'] or
+                    query_lower in info['_tags_lc']):
                 result.append({
                     'id': preset_id,
-                    **metadata
+                    **info['metadata']
                 })
-        return sorted(result, key=lambda x: x.get('name', ''))
+        return result
     def export_preset(self, preset_id: str, export_path: Path) -> bool:
         """
         Export a preset to a file.
@@ -308,8 +427,7 @@ class PresetManager:
         if not preset_data:
             return False
         try:
-            with open(export_path, 'w', encoding='utf-8') as f:
-                json.dump(preset_data, f, indent=2, ensure_ascii=False)
+            _json_dump(export_path, preset_data)
             logger.info(f"Preset exported to: {export_path}")
             return True
         except Exception as e:
@@ -327,8 +445,7 @@ class PresetManager:
         """
         self._ensure_loaded()
         try:
-            with open(import_path, 'r', encoding='utf-8') as f:
-                preset_data = json.load(f)
+            preset_data = _json_load(import_path)
             if 'metadata' not in preset_data or 'settings' not in preset_data:
                 logger.error("Invalid preset file format.")
                 return None
@@ -505,27 +622,20 @@ class PresetManager:
                 'tags': ['outline', 'border', 'edge', 'frame']
             }
         ]
-        for preset in curve_filler_presets:
-            existing = self.search_presets(preset['name'], tool='curve_filler')
-            if not existing:
-                self.save_preset(
-                    name=preset['name'],
-                    tool='curve_filler',
-                    settings=preset['settings'],
-                    description=preset['description'],
-                    category='curve_filler',
-                    tags=preset['tags'],
-                    author='CorelDRAW Automation Toolkit'
-                )
-        for preset in rhinestone_presets:
-            existing = self.search_presets(preset['name'], tool='rhinestone')
-            if not existing:
+        # One pass over the cache instead of a full search per builtin
+        have = {(info['metadata'].get('tool'), info['metadata'].get('name'))
+                for info in self._cache.values()}
+        for tool, presets in (('curve_filler', curve_filler_presets),
+                              ('rhinestone', rhinestone_presets)):
+            for preset in presets:
+                if (tool, preset['name']) in have:
+                    continue
                 self.save_preset(
                     name=preset['name'],
-                    tool='rhinestone',
+                    tool=tool,
                     settings=preset['settings'],
                     description=preset['description'],
-                    category='rhinestone',
+                    category=tool,
                     tags=preset['tags'],
                     author='CorelDRAW Automation Toolkit'
                 )
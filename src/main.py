@@ -3,107 +3,186 @@ CorelDRAW Automation Toolkit
 Main application entry point.
 """
 
+import atexit
 import sys
 import logging
+import os
+import queue
+from functools import lru_cache
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
 from pathlib import Path
+from typing import Optional, Union
 
-# Add project root to path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+# Running as a script (python src/main.py, PyInstaller) needs the project
+# root on sys.path for the src.* imports; `python -m src` already has it
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QFont, QIcon
+from PyQt5.QtWidgets import QApplication, QSplashScreen
+from PyQt5.QtCore import QObject, QRunnable, Qt, QThreadPool, QTimer, pyqtSignal
+from PyQt5.QtGui import QColor, QFont, QFontDatabase, QIcon, QPalette, QPixmap
+
+from src.utils.logger import CachedTimeFormatter
+from src.utils.resources import get_resource_root
+
+
+# Background thread writing queued log records (see setup_logging)
+_log_listener: Optional[QueueListener] = None
+# Log records buffered before a batched write to app.log
+LOG_BUFFER_RECORDS = 256
+
+_APP_LOGGER_NAME = "CorelDRAW_Automation_Toolkit"
+_LOG_FILENAME = "app.log"
+_LOG_FORMATTER = CachedTimeFormatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+_ICONS_DIR = get_resource_root() / "resources" / "icons"
+_THEMES_DIR = get_resource_root() / "resources" / "themes"
+_THEME_FILES = {"dark": "gruvbox_dark"}
+
+# Gruvbox Dark colors applied through the palette rather than a universal
+# QWidget stylesheet rule, which Qt would have to match on every widget
+_GRUVBOX_DARK_PALETTE = (
+    (QPalette.Window, "#3c3836"),
+    (QPalette.WindowText, "#ebdbb2"),
+    (QPalette.Base, "#282828"),
+    (QPalette.AlternateBase, "#3c3836"),
+    (QPalette.Text, "#ebdbb2"),
+    (QPalette.Button, "#3c3836"),
+    (QPalette.ButtonText, "#ebdbb2"),
+    (QPalette.ToolTipBase, "#3c3836"),
+    (QPalette.ToolTipText, "#ebdbb2"),
+    (QPalette.Highlight, "#458588"),
+    (QPalette.HighlightedText, "#282828"),
+)
+
+
+@lru_cache(maxsize=None)
+def _theme_stylesheet(theme_name: str) -> str:
+    """Load the stylesheet for a theme once; later calls reuse the string."""
+    if theme_name not in _THEME_FILES:
+        return ""
+
+    # Stylesheets ship as plain .qss files with colors inlined, so nothing
+    # is formatted at startup; Qt parses the file contents directly
+    qss_file = _THEMES_DIR / f"{_THEME_FILES[theme_name]}.qss"
+    try:
+        return qss_file.read_text(encoding="utf-8")
+    except OSError as e:
+        logging.getLogger(__name__).warning(f"Could not load theme {qss_file}: {e}")
+        return ""
 
 
 def apply_theme(app: QApplication, theme_name: str):
     """Apply application theme."""
     if theme_name == "dark":
-        # Gruvbox Dark theme colors
-        bg = "#282828"
-        bg_bright = "#3c3836"
-        fg = "#ebdbb2"
-        red = "#cc241d"
-        green = "#98971a"
-        yellow = "#d79921"
-        blue = "#458588"
-        aqua = "#689d6a"
-        gray = "#928374"
-        
-        dark_style = f"""
-        QMainWindow {{ background-color: {bg}; }}
-        QWidget {{ background-color: {bg_bright}; color: {fg}; selection-background-color: {blue}; selection-color: {bg}; }}
-        QMenuBar {{ background-color: {bg_bright}; color: {fg}; }}
-        QMenuBar::item:selected {{ background-color: {blue}; }}
-        QMenu {{ background-color: {bg_bright}; border: 1px solid {gray}; }}
-        QMenu::item:selected {{ background-color: {blue}; }}
-        QToolBar {{ background-color: {bg_bright}; border: none; spacing: 3px; }}
-        QPushButton {{ background-color: {gray}; border: none; border-radius: 4px; padding: 6px 16px; color: {fg}; min-width: 80px; }}
-        QPushButton:hover {{ background-color: {aqua}; }}
-        QPushButton:pressed {{ background-color: {blue}; }}
-        QPushButton:disabled {{ background-color: {bg}; color: {gray}; }}
-        QTabWidget::pane {{ border: 1px solid {gray}; background-color: {bg}; }}
-        QTabBar::tab {{ background-color: {bg}; color: {fg}; padding: 8px 16px; border: 1px solid {gray}; border-bottom: none; margin-right: 2px; }}
-        QTabBar::tab:selected {{ background-color: {bg_bright}; border-bottom: 2px solid {red}; }}
-        QTabBar::tab:hover {{ background-color: #504945; }}
-        QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox {{ background-color: {bg}; color: {fg}; border: 1px solid {gray}; border-radius: 3px; padding: 4px; }}
-        QLineEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus, QComboBox:focus {{ border-color: {blue}; }}
-        QSlider::groove:horizontal {{ border: 1px solid {gray}; height: 6px; background-color: {bg}; border-radius: 3px; }}
-        QSlider::handle:horizontal {{ background-color: {blue}; border: 1px solid {aqua}; width: 14px; margin: -4px 0; border-radius: 7px; }}
-        QSlider::handle:horizontal:hover {{ background-color: {aqua}; }}
-        QGroupBox {{ border: 1px solid {gray}; border-radius: 4px; margin-top: 8px; padding-top: 8px; color: {fg}; }}
-        QGroupBox::title {{ subcontrol-origin: margin; left: 10px; padding: 0 5px; color: {yellow}; }}
-        QScrollBar:vertical {{ background-color: {bg}; width: 12px; margin: 0; }}
-        QScrollBar::handle:vertical {{ background-color: {gray}; border-radius: 6px; min-height: 20px; }}
-        QScrollBar::handle:vertical:hover {{ background-color: {aqua}; }}
-        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{ height: 0; }}
-        QStatusBar {{ background-color: {bg}; color: {fg}; }}
-        QProgressBar {{ border: 1px solid {gray}; border-radius: 3px; text-align: center; background-color: {bg}; color: {fg}; }}
-        QProgressBar::chunk {{ background-color: {green}; border-radius: 2px; }}
-        QCheckBox {{ color: {fg}; spacing: 8px; }}
-        QCheckBox::indicator {{ width: 16px; height: 16px; border: 1px solid {gray}; border-radius: 3px; background-color: {bg}; }}
-        QCheckBox::indicator:checked {{ background-color: {blue}; border-color: {blue}; }}
-        QLabel {{ color: {fg}; }}
-        QToolTip {{ background-color: {bg_bright}; color: {fg}; border: 1px solid {gray}; padding: 4px; }}
-        QDockWidget {{ color: {fg}; titlebar-close-icon: none; }}
-        QDockWidget::title {{ background-color: {bg}; padding: 6px; }}
-        QTreeView, QListView, QTableView {{ background-color: {bg}; alternate-background-color: {bg_bright}; border: 1px solid {gray}; color: {fg}; }}
-        QTreeView::item:selected, QListView::item:selected, QTableView::item:selected {{ background-color: {blue}; color: {bg}; }}
-        QHeaderView::section {{ background-color: {bg_bright}; color: {fg}; border: 1px solid {gray}; padding: 4px; }}
-        """
-        app.setStyleSheet(dark_style)
+        palette = QPalette()
+        for role, color in _GRUVBOX_DARK_PALETTE:
+            palette.setColor(role, QColor(color))
     else:
-        app.setStyleSheet("")
+        palette = app.style().standardPalette()
+    app.setPalette(palette)
+    app.setStyleSheet(_theme_stylesheet(theme_name))
 
 
-def setup_logging(log_dir: Path):
-    """Setup application logging."""
-    log_dir.mkdir(parents=True, exist_ok=True)
-    
-    logger = logging.getLogger("CorelDRAW_Automation_Toolkit")
-    logger.setLevel(logging.INFO)
+def setup_logging(log_dir: Union[str, Path], level: str = "INFO"):
+    """
+    Setup application logging.
+
+    Records are handed to a queue and written to the log file by a
+    QueueListener thread, so logging never blocks the UI thread on disk I/O.
+    The listener buffers records and writes them in batches, flushing at
+    once on errors. Call stop_logging() before exit to flush everything.
+
+    The level name can be overridden with the CDA_LOG_LEVEL environment
+    variable; records below it are dropped before they are formatted.
+    """
+    global _log_listener
+    level_name = os.environ.get("CDA_LOG_LEVEL", level).upper()
+    logger = logging.getLogger(_APP_LOGGER_NAME)
+    # getLevelName maps a registered level name to its number; anything
+    # else comes back as a string and falls back to INFO
+    level_no = logging.getLevelName(level_name)
+    logger.setLevel(level_no if isinstance(level_no, int) else logging.INFO)
+    if _log_listener is not None:
+        # Already installed; repeated calls only adjust the level
+        return logger
+
+    log_dir = os.fspath(log_dir)
+    os.makedirs(log_dir, exist_ok=True)
     
-    # File handler
-    log_file = log_dir / "app.log"
+    # File handler, owned by the listener thread
+    log_file = os.path.join(log_dir, _LOG_FILENAME)
     handler = logging.FileHandler(log_file, encoding='utf-8')
-    handler.setLevel(logging.INFO)
-    
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    handler.setFormatter(_LOG_FORMATTER)
+    buffered = MemoryHandler(
+        capacity=LOG_BUFFER_RECORDS,
+        flushLevel=logging.ERROR,
+        target=handler,
+        flushOnClose=True
     )
-    handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    _log_listener = QueueListener(log_queue, buffered, respect_handler_level=True)
+    _log_listener.start()
+    atexit.register(stop_logging)
     
-    logger.addHandler(handler)
-    logger.info("Logging initialized")
+    logger.addHandler(QueueHandler(log_queue))
+    logger.debug("Logging initialized")
     
     return logger
 
 
+def stop_logging():
+    """Stop the log listener thread, writing out any queued records."""
+    global _log_listener
+    if _log_listener is not None:
+        logger = logging.getLogger(_APP_LOGGER_NAME)
+        for handler in [h for h in logger.handlers if isinstance(h, QueueHandler)]:
+            logger.removeHandler(handler)
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.close()
+        _log_listener = None
+
+
+class _MacroInstallSignals(QObject):
+    """Signals reporting the outcome of a background macro install."""
+
+    finished = pyqtSignal(object)  # MacroInstallResult
+    error = pyqtSignal(str)  # error message
+
+
+class _MacroInstallRunnable(QRunnable):
+    """Install bundled macros off the UI thread."""
+
+    def __init__(self, config):
+        super().__init__()
+        self._config = config
+        self.signals = _MacroInstallSignals()
+
+    def run(self):
+        try:
+            from src.core.macro_installer import install_macros_if_needed
+            self.signals.finished.emit(install_macros_if_needed(self._config))
+        except Exception as e:
+            self.signals.error.emit(str(e))
+
+
 def main():
     """Main application entry point."""
-    # Enable High DPI
+    # Dump Python tracebacks on hard crashes (e.g. inside Qt) when profiling
+    if os.environ.get("CDA_PROFILE"):
+        import faulthandler
+        faulthandler.enable()
+
+    # Enable High DPI. On Qt 5.14+ pass fractional scale factors straight
+    # through instead of rounding them
     QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
     QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+    if hasattr(Qt, "HighDpiScaleFactorRoundingPolicy"):
+        QApplication.setHighDpiScaleFactorRoundingPolicy(
+            Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
+        )
 
     # Create app
     app = QApplication(sys.argv)
@@ -112,58 +191,68 @@ def main():
     app.setOrganizationName("CorelDRAW Automation")
     app.setOrganizationDomain("coreldraw-automation.com")
 
-    # Set font
-    font = QFont("Segoe UI", 9)
+    # Set font. The platform's general UI font (Segoe UI on Windows) comes
+    # straight from the system, without a family lookup in the font database
+    font = QFontDatabase.systemFont(QFontDatabase.GeneralFont)
+    font.setPointSize(9)
+    font.setStyleHint(QFont.SansSerif)
     app.setFont(font)
 
+    # Paint a splash before the heavy config/UI imports so the user gets
+    # immediate feedback on a cold start
+    splash = QSplashScreen(QPixmap(str(_ICONS_DIR / "app_icon_128.png")))
+    splash.show()
+    app.processEvents()
+
     # Load config
     from src.config import config
     config.app.theme = config.app.theme or "dark"
     
     # Setup logging
     log_dir = config.logs_directory
-    logger = setup_logging(log_dir)
-    logger.info("Application starting...")
+    logger = setup_logging(log_dir, config.app.log_level)
+    logger.debug("Application starting...")
 
     # Apply theme
     apply_theme(app, config.app.theme)
 
-    # Set application icon
-    try:
-        icon_path = Path(__file__).parent / "resources" / "icons" / "app_icon.png"
-        if icon_path.exists():
-            app.setWindowIcon(QIcon(str(icon_path)))
-    except Exception as e:
-        logger.warning(f"Could not load icon: {e}")
+    # Set application icon; a missing file just yields a null icon, so no
+    # existence check is needed
+    app.setWindowIcon(QIcon(str(_ICONS_DIR / "app_icon.png")))
 
-    # Create and show main window
+    # Create and show main window. Only construction can fail here; the
+    # steps after it run outside the handler
     try:
         from src.ui.main_window import MainWindow
         window = MainWindow()
-        window.show()
-
-        # Install bundled macros after UI is visible (faster startup)
-        def _install_macros_late():
-            try:
-                from src.core.macro_installer import install_macros_if_needed
-                result = install_macros_if_needed(config)
-                if not result.skipped:
-                    logger.info(f"Installed macros: {result.installed} files")
-            except Exception as e:
-                logger.warning(f"Macro install skipped: {e}")
-
-        QTimer.singleShot(250, _install_macros_late)
     except Exception as e:
-        logger.error(f"Failed to create window: {e}")
-        import traceback
-        traceback.print_exc()
+        splash.close()
+        logger.exception(f"Failed to create window: {e}")
+        stop_logging()
         return 1
 
-    logger.info("Application started successfully")
+    window.show()
+    splash.finish(window)
+
+    # Install bundled macros on a pool thread once the UI is visible;
+    # results are delivered back to the UI thread through signals
+    def _on_macros_installed(result):
+        if not result.skipped:
+            logger.info(f"Installed macros: {result.installed} files")
+
+    macro_install = _MacroInstallRunnable(config)
+    macro_install.signals.finished.connect(_on_macros_installed)
+    macro_install.signals.error.connect(
+        lambda message: logger.warning(f"Macro install skipped: {message}")
+    )
+    QTimer.singleShot(250, lambda: QThreadPool.globalInstance().start(macro_install))
+
+    logger.debug("Application started successfully")
 
     # Run
     exit_code = app.exec()
-    logger.info(f"Application exiting with code {exit_code}")
+    logger.debug(f"Application exiting with code {exit_code}")
+    stop_logging()
     sys.exit(exit_code)
 
 
@@ -4,17 +4,32 @@ PyQt5 UI for batch processing automation.
 """
 
 import logging
+import os
 import shutil
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+try:
+    import pywintypes
+    HAS_PYWINTYPES = True
+except ImportError:
+    HAS_PYWINTYPES = False
+    pywintypes = None
 
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QFormLayout,
     QLabel, QPushButton, QSpinBox, QComboBox, QCheckBox,
-    QListWidget, QProgressBar, QFileDialog, QLineEdit,
-    QMessageBox, QListWidgetItem, QPlainTextEdit
+    QListView, QProgressBar, QFileDialog, QLineEdit,
+    QMessageBox, QPlainTextEdit
+)
+from PyQt5.QtCore import (
+    Qt, QObject, QTimer, QFileSystemWatcher, QAbstractListModel, QModelIndex,
+    pyqtSignal, QThread, pyqtSlot
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QThread, pyqtSlot
 
 from ...config import config
 from ...core.corel_interface import corel
@@ -24,6 +39,454 @@ from ...ui.icon_utils import apply_button_icons
 
 logger = logging.getLogger(__name__)
 
+# Errors raised by COM calls; without pywin32 there is no COM to fail
+COM_ERRORS = (pywintypes.com_error,) if HAS_PYWINTYPES else ()
+
+# How many files ahead of the one open in CorelDRAW get backed up
+BACKUP_LOOKAHEAD = 2
+
+# Log lines are appended to the view in batches at most this often (ms)
+LOG_FLUSH_INTERVAL = 100
+LOG_MAX_BLOCKS = 5000
+
+# Minimum time between progress updates (s); about 30 repaints a second
+PROGRESS_MIN_INTERVAL = 1 / 30
+
+# Quiet period after the last change in the watch folder before it is scanned (ms)
+WATCH_DEBOUNCE_MS = 1000
+
+
+# FillSettings values used when a preset omits a key
+_FILL_DEFAULTS = {
+    "spacing_mode": "fixed",
+    "spacing_value": 10.0,
+    "spacing_percentage": 100.0,
+    "spacing_min": 5.0,
+    "spacing_max": 20.0,
+    "start_padding": 0.0,
+    "end_padding": 0.0,
+    "angle_mode": "follow_curve",
+    "fixed_angle": 0.0,
+    "angle_min": 0.0,
+    "angle_max": 360.0,
+    "angle_increment": 15.0,
+    "element_count": 0,
+    "offset_from_curve": 0.0,
+    "collision_detection": False,
+    "smart_corners": True,
+    "distribute_evenly": False,
+    "scale_mode": "uniform",
+    "scale_factor": 1.0,
+    "scale_start": 0.5,
+    "scale_end": 1.5,
+    "pattern_mode": "single",
+}
+
+
+def _fill_settings_from_preset(preset: Dict[str, Any]) -> FillSettings:
+    """Build FillSettings from a saved preset, ignoring unknown keys."""
+    values = {key: preset.get(key, default) for key, default in _FILL_DEFAULTS.items()}
+    values["spacing_mode"] = SpacingMode(values["spacing_mode"])
+    values["angle_mode"] = AngleMode(values["angle_mode"])
+    values["pattern_mode"] = PatternMode(values["pattern_mode"])
+    return FillSettings(**values)
+
+
+# Before 3.12, shutil.copy2 on Windows copies through a Python read/write
+# loop; CopyFileW hands the whole copy to the OS instead
+_CopyFileW = None
+if os.name == "nt" and sys.version_info < (3, 12):
+    import ctypes
+    from ctypes import wintypes
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _CopyFileW = _kernel32.CopyFileW
+    _CopyFileW.argtypes = (wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.BOOL)
+    _CopyFileW.restype = wintypes.BOOL
+
+
+def _fast_copy(src: str, dst: str):
+    """Copy a file and its metadata, letting the OS do the data copy."""
+    if _CopyFileW is None:
+        # POSIX copy2 already uses sendfile/fcopyfile
+        shutil.copy2(src, dst)
+        return
+    if not _CopyFileW(src, dst, False):
+        raise ctypes.WinError(ctypes.get_last_error())
+    shutil.copystat(src, dst)
+
+
+def _iter_cdr_files(folder: str):
+    """
+    Yield the paths of the .cdr files directly inside folder.
+
+    An unreadable or offline folder is logged and yields nothing; callers
+    run in Qt slots, where an escaping exception would abort the app.
+    """
+    try:
+        with os.scandir(folder) as it:
+            for entry in it:
+                if entry.name.lower().endswith(".cdr") and entry.is_file():
+                    yield entry.path
+    except OSError as e:
+        logger.warning(f"Cannot list folder {folder}: {e}")
+
+
+class BatchWorker(QObject):
+    """
+    Runs the batch loop on a worker thread.
+
+    Works from a snapshot of the widget's settings and reports back only
+    through signals, so the UI stays responsive and can request a stop
+    between files.
+    """
+
+    file_done = pyqtSignal(str)
+    error = pyqtSignal(str, str)  # file path, message
+    message = pyqtSignal(str)
+    # current, total, file being processed; throttled to PROGRESS_MIN_INTERVAL
+    progress = pyqtSignal(int, int, str)
+    finished = pyqtSignal()
+
+    def __init__(self, options: Dict[str, Any], file_list: List[str]):
+        super().__init__()
+        self._options = options
+        self._file_list = list(file_list)
+        self._stop = False
+
+    def stop(self):
+        """Stop before the next file."""
+        self._stop = True
+
+    @pyqtSlot()
+    def run(self):
+        """Process every queued file, then emit finished."""
+        # Lookahead backups not yet awaited, keyed by file index
+        pending_backups: Dict[int, Future] = {}
+        try:
+            # Backups are plain file copies, so they run on a small pool
+            # while COM work stays on this thread. Pool threads only start
+            # once something is submitted
+            with corel.thread_apartment(), ThreadPoolExecutor(
+                max_workers=self._options["io_workers"]
+            ) as backup_pool:
+                try:
+                    self._process_files(backup_pool, pending_backups)
+                finally:
+                    self._discard_backups(pending_backups)
+        except Exception as e:
+            logger.error(f"Batch worker error: {e}")
+            self.error.emit("", str(e))
+        finally:
+            self.finished.emit()
+
+    def _discard_backups(self, pending_backups: Dict[int, Future]):
+        """
+        Drop lookahead backups of files the loop never reached.
+
+        Left over after a stop or an unexpected error. Queued copies are
+        cancelled; copies already under way are waited for and removed.
+        """
+        for i, future in pending_backups.items():
+            if future.cancel():
+                continue
+            try:
+                future.result()
+                os.remove(f"{self._file_list[i]}.bak")
+            except OSError:
+                pass
+        pending_backups.clear()
+
+    def _process_files(self, backup_pool: ThreadPoolExecutor,
+                       pending_backups: Dict[int, Future]):
+        opts = self._options
+        curve_fill_enabled = opts["curve_fill"]
+        export_enabled = opts["export"]
+        resize_enabled = opts["resize"]
+        color_enabled = opts["color"]
+        preset_settings = opts["preset_settings"]
+        output_dir = opts["output_dir"]
+        # Exports are written to a new file and leave the source untouched,
+        # so a backup is only needed when the document is saved in place
+        backup_enabled = opts["backup"] and not export_enabled
+        page_width, page_height = opts["resize_size"]
+        color_mode = opts["color_mode"]
+        fmt = opts["export_format"]
+        naming = opts["naming"]
+        affix = opts["affix"]
+
+        # The preset is fixed for the whole batch, so convert it once
+        fill_settings = None
+        if curve_fill_enabled and preset_settings:
+            try:
+                fill_settings = _fill_settings_from_preset(preset_settings)
+            except (TypeError, ValueError) as e:
+                self.message.emit(f"Curve fill disabled: invalid preset settings ({e})")
+        engine = CurveFillerEngine() if fill_settings is not None else None
+
+        files = self._file_list
+        total = len(files)
+        last_progress = 0.0
+
+        # Output directories already created this batch
+        made_dirs: Set[str] = set()
+        if export_enabled and output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+            made_dirs.add(output_dir)
+
+        for i, file_path in enumerate(files):
+            if self._stop:
+                break
+
+            if backup_enabled:
+                # Queue copies for this file and the next few so disk I/O
+                # overlaps with CorelDRAW working on the current document
+                for j in range(i, min(i + BACKUP_LOOKAHEAD + 1, total)):
+                    if j not in pending_backups:
+                        pending_backups[j] = backup_pool.submit(
+                            _fast_copy, files[j], f"{files[j]}.bak"
+                        )
+
+            now = time.monotonic()
+            if now - last_progress >= PROGRESS_MIN_INTERVAL or i + 1 == total:
+                self.progress.emit(i + 1, total, file_path)
+                last_progress = now
+
+            doc = None
+            try:
+                # Wait for this file's backup; a failed copy skips the file
+                if backup_enabled:
+                    pending_backups.pop(i).result()
+
+                # Open document
+                doc = corel.app.OpenDocument(file_path)
+                modified = False
+
+                # Resize document
+                if resize_enabled:
+                    try:
+                        doc.ActivePage.SizeWidth = page_width
+                        doc.ActivePage.SizeHeight = page_height
+                        modified = True
+                    except Exception as e:
+                        logger.warning(f"Resize failed: {e}")
+
+                # Convert colors (best-effort)
+                if color_enabled:
+                    try:
+                        if color_mode == "cmyk":
+                            doc.ConvertToCMYK()
+                        elif color_mode == "rgb":
+                            doc.ConvertToRGB()
+                        elif color_mode == "grayscale":
+                            doc.ConvertToGrayscale()
+                        modified = True
+                    except Exception as e:
+                        logger.warning(f"Color conversion failed: {e}")
+
+                # Apply curve fill preset if possible
+                if engine is not None:
+                    try:
+                        container, elements = self._resolve_curve_fill_targets(doc)
+                        if container and elements and elements.Count > 0:
+                            engine.set_container(container)
+                            engine.set_fill_elements(elements)
+                            modified = bool(engine.execute_fill(settings=fill_settings)) or modified
+                        else:
+                            self.message.emit("Curve fill skipped: no valid container/elements.")
+                    except Exception as e:
+                        self.message.emit(f"Curve fill failed: {e}")
+                    finally:
+                        # Don't keep shapes of a document that is about to close
+                        engine.reset()
+
+                # Export or save
+                if export_enabled:
+                    # Plain string path ops; no Path objects in the per-file loop
+                    src_dir, src_name = os.path.split(file_path)
+                    out_dir = output_dir or src_dir
+                    if out_dir not in made_dirs:
+                        os.makedirs(out_dir, exist_ok=True)
+                        made_dirs.add(out_dir)
+                    base = os.path.splitext(src_name)[0]
+                    if naming == "suffix":
+                        name = f"{base}{affix}"
+                    elif naming == "prefix":
+                        name = f"{affix}{base}"
+                    elif naming == "sequential":
+                        name = f"{base}_{i+1:03d}"
+                    else:
+                        name = base
+                    out_path = os.path.join(out_dir, f"{name}.{fmt}")
+                    try:
+                        doc.SaveAs(out_path)
+                    except Exception as e:
+                        logger.warning(f"Export failed: {e}")
+                elif modified:
+                    # A failed in-place save is reported as this file's error
+                    doc.Save()
+
+                logger.info(f"Processed: {file_path}")
+                self.file_done.emit(file_path)
+
+            except Exception as e:
+                logger.error(f"Processing error ({file_path}): {e}")
+                self.error.emit(file_path, str(e))
+            finally:
+                if doc is not None:
+                    try:
+                        doc.Close()
+                    except COM_ERRORS as e:
+                        logger.warning(f"Close failed ({file_path}): HRESULT {e.hresult & 0xFFFFFFFF:#010x}")
+                    except Exception as e:
+                        logger.warning(f"Close failed ({file_path}): {e}")
+
+    def _resolve_curve_fill_targets(self, doc):
+        """Resolve container and elements for curve fill."""
+        container_name = self._options["container_name"]
+        elements_name = self._options["elements_name"]
+        layer_name = self._options["layer_name"]
+
+        # 1) Prefer current selection if valid. A freshly opened document
+        # rarely has one, so check the count first instead of letting
+        # get_selection() raise (and log) for every file
+        try:
+            if corel.get_selection_count() >= 2:
+                selection = corel.get_selection()
+                container = selection.Item(1)
+                if getattr(container, "Curve", None) is not None:
+                    elements = corel.app.CreateShapeRange()
+                    for idx in range(2, selection.Count + 1):
+                        elements.Add(selection.Item(idx))
+                    return container, elements
+        except Exception:
+            pass
+
+        # 2) Auto-select by name/layer. Without element criteria nothing
+        # could be filled, so the page is not scanned at all
+        if not (elements_name or layer_name):
+            return None, None
+
+        container = None
+        elements = corel.app.CreateShapeRange()
+
+        # Matching is pure Python over the infos; Curve is only read for
+        # shapes that are candidates for a container/element decision
+        for shape, name, layer_match in self._read_shape_infos(doc, layer_name):
+            try:
+                has_curve = None
+                if not container and ((container_name and container_name in name) or layer_match):
+                    has_curve = getattr(shape, "Curve", None) is not None
+                    if has_curve:
+                        container = shape
+
+                if elements_name:
+                    if elements_name in name:
+                        elements.Add(shape)
+                elif layer_match:
+                    if has_curve is None:
+                        has_curve = getattr(shape, "Curve", None) is not None
+                    if not has_curve:
+                        elements.Add(shape)
+            except Exception:
+                continue
+
+        return container, elements
+
+    @staticmethod
+    def _read_shape_infos(doc, layer_name: str) -> List[Tuple[Any, str, bool]]:
+        """
+        Read (shape, lowercase name, layer match) for each shape on the active page.
+
+        One COM round trip per property per shape; the layer is only read
+        when filtering by layer.
+        """
+        infos = []
+        try:
+            page = doc.ActivePage
+            shapes = page.Shapes if page else None
+            count = shapes.Count if shapes is not None else 0
+        except Exception:
+            return infos
+
+        item = shapes.Item
+        for i in range(1, count + 1):
+            try:
+                shape = item(i)
+                name = (getattr(shape, "Name", "") or "").lower()
+                layer_match = False
+                if layer_name:
+                    layer = getattr(shape, "Layer", None)
+                    layer_match = layer is not None and (getattr(layer, "Name", "") or "").lower() == layer_name
+            except Exception:
+                continue
+            infos.append((shape, name, layer_match))
+        return infos
+
+
+class FileQueueModel(QAbstractListModel):
+    """
+    List model over the queued file paths.
+
+    Rows show the file name; the full path is the tooltip. Paths are kept
+    in a plain list (with a set for duplicate checks) instead of one
+    QListWidgetItem per file, so very large queues stay cheap.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._paths: List[str] = []
+        self._path_set: Set[str] = set()
+
+    @property
+    def paths(self) -> List[str]:
+        """Queued paths in queue order. Treat as read-only."""
+        return self._paths
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._paths)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return os.path.basename(self._paths[index.row()])
+        if role == Qt.ToolTipRole:
+            return self._paths[index.row()]
+        return None
+
+    def add_paths(self, paths: List[str]) -> int:
+        """Append paths that are not queued yet. Returns how many were added."""
+        new_paths = []
+        seen = self._path_set
+        for path in paths:
+            if path not in seen:
+                seen.add(path)
+                new_paths.append(path)
+
+        if new_paths:
+            first = len(self._paths)
+            self.beginInsertRows(QModelIndex(), first, first + len(new_paths) - 1)
+            self._paths.extend(new_paths)
+            self.endInsertRows()
+        return len(new_paths)
+
+    def removeRows(self, row: int, count: int, parent=QModelIndex()) -> bool:
+        if parent.isValid() or count <= 0 or row < 0 or row + count > len(self._paths):
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        for path in self._paths[row:row + count]:
+            self._path_set.discard(path)
+        del self._paths[row:row + count]
+        self.endRemoveRows()
+        return True
+
+    def clear(self):
+        """Remove all paths."""
+        self.beginResetModel()
+        self._paths.clear()
+        self._path_set.clear()
+        self.endResetModel()
+
 
 class BatchProcessorWidget(QWidget):
     """Widget for batch processing operations."""
@@ -34,8 +497,35 @@ class BatchProcessorWidget(QWidget):
     def __init__(self, parent=None):
         """Initialize the batch processor widget."""
         super().__init__(parent)
-        self._file_list = []
+        self._queue = FileQueueModel(self)
+        # (preset name, settings) of the last preset loaded for a batch
+        self._cached_preset: Optional[Tuple[str, Optional[Dict[str, Any]]]] = None
+        self._thread = None
+        self._worker = None
+        self._stop_requested = False
+        self._log_buf = deque()
         self._init_ui()
+
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(LOG_FLUSH_INTERVAL)
+        self._log_timer.timeout.connect(self._flush_log)
+
+        # Watch folder: directory change notifications are coalesced by a
+        # single-shot timer, then the folder is diffed against what was seen
+        self._watched_dir: Optional[str] = None
+        self._watched_seen: Set[str] = set()
+        self._watch_pending: List[str] = []
+        self._fs_watcher = QFileSystemWatcher(self)
+        self._fs_watcher.directoryChanged.connect(self._on_watch_dir_changed)
+        self._watch_timer = QTimer(self)
+        self._watch_timer.setSingleShot(True)
+        self._watch_timer.setInterval(WATCH_DEBOUNCE_MS)
+        self._watch_timer.timeout.connect(self._scan_watch_folder)
+        self.watch_enabled.toggled.connect(self._update_watcher)
+        self.watch_folder.editingFinished.connect(self._update_watcher)
+        self._update_watcher()
+
         logger.info("Batch processor widget initialized.")
 
     def _init_ui(self):
@@ -48,9 +538,12 @@ class BatchProcessorWidget(QWidget):
         files_layout = QVBoxLayout(files_group)
         files_layout.setContentsMargins(8, 8, 8, 8)
 
-        self.file_list_widget = QListWidget()
-        self.file_list_widget.setMinimumHeight(150)
-        files_layout.addWidget(self.file_list_widget)
+        self.file_list_view = QListView()
+        self.file_list_view.setModel(self._queue)
+        self.file_list_view.setSelectionMode(QListView.ExtendedSelection)
+        self.file_list_view.setUniformItemSizes(True)
+        self.file_list_view.setMinimumHeight(150)
+        files_layout.addWidget(self.file_list_view)
 
         file_btn_layout = QHBoxLayout()
 
@@ -84,14 +577,15 @@ class BatchProcessorWidget(QWidget):
         operation_layout = QVBoxLayout(operation_group)
 
         # Curve fill operation
-        curve_fill_check = QCheckBox("Apply Curve Fill Preset")
-        operation_layout.addWidget(curve_fill_check)
+        self.curve_fill_check = QCheckBox("Apply Curve Fill Preset")
+        operation_layout.addWidget(self.curve_fill_check)
 
         self.curve_fill_preset = QComboBox()
         self.curve_fill_preset.addItem("Select preset...")
         self.curve_fill_preset.addItem("Basic Grid Fill")
         self.curve_fill_preset.addItem("Path Following")
         self.curve_fill_preset.addItem("Decorative Scatter")
+        self.curve_fill_preset.currentIndexChanged.connect(self._invalidate_cached_preset)
         operation_layout.addWidget(self.curve_fill_preset)
 
         self.curve_container_name = QLineEdit()
@@ -111,8 +605,8 @@ class BatchProcessorWidget(QWidget):
         operation_layout.addWidget(hint)
 
         # Export operation
-        export_check = QCheckBox("Export to Format")
-        operation_layout.addWidget(export_check)
+        self.export_check = QCheckBox("Export to Format")
+        operation_layout.addWidget(self.export_check)
 
         self.export_format = QComboBox()
         self.export_format.addItem("PDF", "pdf")
@@ -124,8 +618,8 @@ class BatchProcessorWidget(QWidget):
         operation_layout.addWidget(self.export_format)
 
         # Resize operation
-        resize_check = QCheckBox("Resize Documents")
-        operation_layout.addWidget(resize_check)
+        self.resize_check = QCheckBox("Resize Documents")
+        operation_layout.addWidget(self.resize_check)
 
         resize_layout = QHBoxLayout()
         self.resize_width = QSpinBox()
@@ -144,8 +638,8 @@ class BatchProcessorWidget(QWidget):
         operation_layout.addLayout(resize_layout)
 
         # Color conversion
-        color_check = QCheckBox("Convert Colors")
-        operation_layout.addWidget(color_check)
+        self.color_check = QCheckBox("Convert Colors")
+        operation_layout.addWidget(self.color_check)
 
         self.color_mode = QComboBox()
         self.color_mode.addItem("CMYK", "cmyk")
@@ -218,6 +712,7 @@ class BatchProcessorWidget(QWidget):
 
         self.log_output = QPlainTextEdit()
         self.log_output.setReadOnly(True)
+        self.log_output.setMaximumBlockCount(LOG_MAX_BLOCKS)
         self.log_output.setMinimumHeight(120)
         progress_layout.addWidget(self.log_output)
 
@@ -260,11 +755,7 @@ class BatchProcessorWidget(QWidget):
             "CorelDRAW Files (*.cdr);;All Files (*)"
         )
 
-        for file_path in files:
-            if file_path not in self._file_list:
-                self._file_list.append(file_path)
-                self.file_list_widget.addItem(Path(file_path).name)
-
+        self._enqueue(files)
         self.status_message.emit(f"Added {len(files)} file(s) to queue")
 
     def _add_folder(self):
@@ -275,32 +766,38 @@ class BatchProcessorWidget(QWidget):
         )
 
         if folder:
-            folder_path = Path(folder)
-            cdr_files = list(folder_path.glob("*.cdr"))
-
-            for file_path in cdr_files:
-                str_path = str(file_path)
-                if str_path not in self._file_list:
-                    self._file_list.append(str_path)
-                    self.file_list_widget.addItem(file_path.name)
-
+            cdr_files = list(_iter_cdr_files(folder))
+            self._enqueue(cdr_files)
             self.status_message.emit(f"Added {len(cdr_files)} file(s) from folder")
 
+    def _enqueue(self, paths: List[str]):
+        """Append paths that are not queued yet."""
+        self._queue.add_paths(paths)
+
     def _remove_selected(self):
         """Remove selected files from queue."""
-        selected_items = self.file_list_widget.selectedItems()
-        for item in selected_items:
-            row = self.file_list_widget.row(item)
-            self.file_list_widget.takeItem(row)
-            if row < len(self._file_list):
-                del self._file_list[row]
+        rows = sorted(
+            (index.row() for index in self.file_list_view.selectionModel().selectedRows()),
+            reverse=True,
+        )
+        if not rows:
+            return
 
-        self.status_message.emit(f"Removed {len(selected_items)} file(s)")
+        # Remove contiguous runs bottom-up so earlier row numbers stay valid
+        end = start = rows[0]
+        for row in rows[1:]:
+            if row == start - 1:
+                start = row
+                continue
+            self._queue.removeRows(start, end - start + 1)
+            end = start = row
+        self._queue.removeRows(start, end - start + 1)
+
+        self.status_message.emit(f"Removed {len(rows)} file(s)")
 
     def _clear_list(self):
         """Clear all files from queue."""
-        self.file_list_widget.clear()
-        self._file_list.clear()
+        self._queue.clear()
         self.status_message.emit("File queue cleared")
 
     def _browse_output(self):
@@ -320,10 +817,71 @@ class BatchProcessorWidget(QWidget):
         )
         if folder:
             self.watch_folder.setText(folder)
+            self._update_watcher()
+
+    def _update_watcher(self):
+        """Watch the configured folder while watch mode is enabled."""
+        folder = self.watch_folder.text().strip()
+        if not (self.watch_enabled.isChecked() and folder and os.path.isdir(folder)):
+            folder = None
+        else:
+            folder = os.path.normpath(folder)
+        # editingFinished also fires on every focus loss; keep the current
+        # watch (and any pending scan) unless the target actually changed
+        if folder == self._watched_dir:
+            return
+
+        self._watch_timer.stop()
+        watched = self._fs_watcher.directories()
+        if watched:
+            self._fs_watcher.removePaths(watched)
+        self._watched_dir = folder
+        if folder is None:
+            self._watched_seen.clear()
+            return
+
+        # Only files that arrive from now on are processed
+        self._watched_seen = set(_iter_cdr_files(folder))
+        self._fs_watcher.addPath(folder)
+        self._log(f"Watching folder: {folder}")
+
+    @pyqtSlot(str)
+    def _on_watch_dir_changed(self, path: str):
+        # Restart the debounce window; a burst of copies triggers one scan
+        self._watch_timer.start()
+
+    def _scan_watch_folder(self):
+        """Queue .cdr files that appeared in the watch folder and process them."""
+        folder = self._watched_dir
+        if folder is None or not os.path.isdir(folder):
+            return
+
+        new_files = [p for p in _iter_cdr_files(folder) if p not in self._watched_seen]
+        if not new_files:
+            return
+
+        self._watched_seen.update(new_files)
+        self._enqueue(new_files)
+        self._watch_pending.extend(new_files)
+        self._log(f"Watch folder: {len(new_files)} new file(s)")
+        self._process_watch_pending()
+
+    def _process_watch_pending(self):
+        """Start a batch for newly watched files unless one is running."""
+        if self._worker is not None or not self._watch_pending:
+            return
+
+        if not corel.is_connected:
+            self._log("Watch folder: not connected to CorelDRAW; new files left in the queue")
+            self._watch_pending.clear()
+            return
+
+        files, self._watch_pending = self._watch_pending, []
+        self._run_batch(files)
 
     def _start_processing(self):
         """Start batch processing."""
-        if not self._file_list:
+        if not self._queue.paths:
             QMessageBox.warning(self, "No Files", "Please add files to the queue first.")
             return
 
@@ -331,243 +889,173 @@ class BatchProcessorWidget(QWidget):
             QMessageBox.warning(self, "Not Connected", "Please connect to CorelDRAW first.")
             return
 
+        self._run_batch(self._queue.paths)
+
+    def _run_batch(self, files: List[str]):
+        """Process files on a worker thread."""
         self.start_btn.setEnabled(False)
         self.stop_btn.setEnabled(True)
 
-        total = len(self._file_list)
+        total = len(files)
         self.batch_progress.setMaximum(total)
 
-        curve_fill_enabled = False
-        export_enabled = False
-        resize_enabled = False
-        color_enabled = False
-
         # Extract enabled operations
-        for child in self.findChildren(QCheckBox):
-            if child.text() == "Apply Curve Fill Preset":
-                curve_fill_enabled = child.isChecked()
-            elif child.text() == "Export to Format":
-                export_enabled = child.isChecked()
-            elif child.text() == "Resize Documents":
-                resize_enabled = child.isChecked()
-            elif child.text() == "Convert Colors":
-                color_enabled = child.isChecked()
+        curve_fill_enabled = self.curve_fill_check.isChecked()
+        export_enabled = self.export_check.isChecked()
+        resize_enabled = self.resize_check.isChecked()
+        color_enabled = self.color_check.isChecked()
+
+        # Nothing would change, so don't back up, open and re-save every file
+        if not (curve_fill_enabled or export_enabled or resize_enabled or color_enabled):
+            self._log("Skipped batch: no operations selected")
+            self.start_btn.setEnabled(True)
+            self.stop_btn.setEnabled(False)
+            return
 
         preset_name = self.curve_fill_preset.currentText()
         preset_settings = None
         if curve_fill_enabled and preset_name and preset_name != "Select preset...":
-            matches = preset_manager.search_presets(preset_name, tool="curve_filler")
-            if matches:
-                preset_data = preset_manager.load_preset(matches[0]["id"])
-                if preset_data:
-                    preset_settings = preset_data.get("settings", {})
+            preset_settings = self._load_preset_settings(preset_name)
+
+        # Widgets must not be touched from the worker thread, so everything
+        # the loop needs is read here once
+        options = {
+            "curve_fill": curve_fill_enabled,
+            "export": export_enabled,
+            "resize": resize_enabled,
+            "color": color_enabled,
+            "preset_settings": preset_settings,
+            "backup": self.create_backup.isChecked(),
+            "resize_size": (self.resize_width.value(), self.resize_height.value()),
+            "color_mode": self.color_mode.currentData(),
+            "export_format": self.export_format.currentData(),
+            "naming": self.naming_pattern.currentData(),
+            "affix": self.suffix_text.text(),
+            "output_dir": self.output_folder.text().strip() or None,
+            "container_name": self.curve_container_name.text().strip().lower(),
+            "elements_name": self.curve_elements_name.text().strip().lower(),
+            "layer_name": self.curve_layer_name.text().strip().lower(),
+            # CorelDRAW serves every COM client from its single running
+            # instance, so only file I/O can run in parallel
+            "io_workers": (
+                max(1, min(config.batch_processor.max_threads, os.cpu_count() or 1))
+                if config.batch_processor.parallel_processing else 1
+            ),
+        }
 
-        output_dir = self.output_folder.text().strip() or None
+        self._stop_requested = False
+        self._thread = QThread(self)
+        self._worker = BatchWorker(options, files)
+        self._worker.moveToThread(self._thread)
 
-        for i, file_path in enumerate(self._file_list):
-            self.current_file_label.setText(f"Processing: {Path(file_path).name}")
-            self.batch_progress.setValue(i + 1)
-            self.progress_updated.emit(i + 1, total)
-            self._log(f"Processing: {file_path}")
+        self._thread.started.connect(self._worker.run)
+        self._worker.file_done.connect(self._on_file_done)
+        self._worker.error.connect(self._on_file_error)
+        self._worker.message.connect(self._log)
+        self._worker.progress.connect(self._on_progress)
+        self._worker.finished.connect(self._on_batch_finished)
+        self._worker.finished.connect(self._thread.quit)
+        self._worker.finished.connect(self._worker.deleteLater)
+        self._thread.finished.connect(self._thread.deleteLater)
 
-            try:
-                # Backup if enabled
-                if self.create_backup.isChecked():
-                    backup_path = f"{file_path}.bak"
-                    shutil.copy2(file_path, backup_path)
+        self._thread.start()
 
-                # Open document
-                doc = corel.app.OpenDocument(file_path)
+    def _load_preset_settings(self, preset_name: str) -> Optional[Dict[str, Any]]:
+        """Look up a curve filler preset's settings, reusing the last lookup."""
+        if self._cached_preset is not None and self._cached_preset[0] == preset_name:
+            return self._cached_preset[1]
 
-                # Resize document
-                if resize_enabled:
-                    try:
-                        doc.ActivePage.SizeWidth = self.resize_width.value()
-                        doc.ActivePage.SizeHeight = self.resize_height.value()
-                    except Exception as e:
-                        logger.warning(f"Resize failed: {e}")
-
-                # Convert colors (best-effort)
-                if color_enabled:
-                    try:
-                        mode = self.color_mode.currentData()
-                        if mode == "cmyk":
-                            doc.ConvertToCMYK()
-                        elif mode == "rgb":
-                            doc.ConvertToRGB()
-                        elif mode == "grayscale":
-                            doc.ConvertToGrayscale()
-                    except Exception as e:
-                        logger.warning(f"Color conversion failed: {e}")
-
-                # Apply curve fill preset if possible
-                if curve_fill_enabled and preset_settings:
-                    try:
-                        engine = CurveFillerEngine()
-                        container, elements = self._resolve_curve_fill_targets(doc)
-                        if container and elements and elements.Count > 0:
-                            engine.set_container(container)
-                            engine.set_fill_elements(elements)
-                            settings = FillSettings(
-                                spacing_mode=SpacingMode(preset_settings.get("spacing_mode", "fixed")),
-                                spacing_value=preset_settings.get("spacing_value", 10.0),
-                                spacing_percentage=preset_settings.get("spacing_percentage", 100.0),
-                                spacing_min=preset_settings.get("spacing_min", 5.0),
-                                spacing_max=preset_settings.get("spacing_max", 20.0),
-                                start_padding=preset_settings.get("start_padding", 0.0),
-                                end_padding=preset_settings.get("end_padding", 0.0),
-                                angle_mode=AngleMode(preset_settings.get("angle_mode", "follow_curve")),
-                                fixed_angle=preset_settings.get("fixed_angle", 0.0),
-                                angle_min=preset_settings.get("angle_min", 0.0),
-                                angle_max=preset_settings.get("angle_max", 360.0),
-                                angle_increment=preset_settings.get("angle_increment", 15.0),
-                                element_count=preset_settings.get("element_count", 0),
-                                offset_from_curve=preset_settings.get("offset_from_curve", 0.0),
-                                collision_detection=preset_settings.get("collision_detection", False),
-                                smart_corners=preset_settings.get("smart_corners", True),
-                                distribute_evenly=preset_settings.get("distribute_evenly", False),
-                                scale_mode=preset_settings.get("scale_mode", "uniform"),
-                                scale_factor=preset_settings.get("scale_factor", 1.0),
-                                scale_start=preset_settings.get("scale_start", 0.5),
-                                scale_end=preset_settings.get("scale_end", 1.5),
-                                pattern_mode=PatternMode(preset_settings.get("pattern_mode", "single")),
-                            )
-                            engine.execute_fill(settings=settings)
-                        else:
-                            msg = "Curve fill skipped: no valid container/elements."
-                            self._log(msg)
-                            QMessageBox.warning(self, "Curve Fill Skipped", msg)
-                    except Exception as e:
-                        self._log(f"Curve fill failed: {e}")
-
-                # Export or save
-                if export_enabled:
-                    fmt = self.export_format.currentData()
-                    src_path = Path(file_path)
-                    out_dir = Path(output_dir) if output_dir else src_path.parent
-                    out_dir.mkdir(parents=True, exist_ok=True)
-                    base = src_path.stem
-                    if self.naming_pattern.currentData() == "suffix":
-                        name = f"{base}{self.suffix_text.text()}"
-                    elif self.naming_pattern.currentData() == "prefix":
-                        name = f"{self.suffix_text.text()}{base}"
-                    elif self.naming_pattern.currentData() == "sequential":
-                        name = f"{base}_{i+1:03d}"
-                    else:
-                        name = base
-                    out_path = out_dir / f"{name}.{fmt}"
-                    try:
-                        doc.SaveAs(str(out_path))
-                    except Exception as e:
-                        logger.warning(f"Export failed: {e}")
-                else:
-                    try:
-                        doc.Save()
-                    except Exception:
-                        pass
+        preset_settings = None
+        matches = preset_manager.search_presets(preset_name, tool="curve_filler")
+        if matches:
+            preset_data = preset_manager.load_preset(matches[0]["id"])
+            if preset_data:
+                preset_settings = preset_data.get("settings", {})
 
-                try:
-                    doc.Close()
-                except Exception:
-                    pass
+        self._cached_preset = (preset_name, preset_settings)
+        return preset_settings
 
-                logger.info(f"Processed: {file_path}")
-                self._log(f"Done: {file_path}")
+    def _invalidate_cached_preset(self):
+        self._cached_preset = None
 
-            except Exception as e:
-                logger.error(f"Processing error ({file_path}): {e}")
-                self._log(f"Error: {file_path} -> {e}")
+    def _stop_processing(self):
+        """Stop batch processing after the current file."""
+        if self._worker is not None:
+            self._worker.stop()
+        self._stop_requested = True
+        self.stop_btn.setEnabled(False)
+        self.current_file_label.setText("Stopping after current file...")
 
-        self.current_file_label.setText(f"Completed {total} file(s)")
-        self.status_message.emit(f"Batch processing completed: {total} files")
+    def shutdown(self):
+        """Stop a running batch and wait for its thread to exit."""
+        if self._thread is None:
+            return
+        if self._worker is not None:
+            self._worker.stop()
+        # The worker finishes its current file, then quits the thread
+        self._thread.quit()
+        self._thread.wait()
+
+    @pyqtSlot(str)
+    def _on_file_done(self, file_path: str):
+        self._log(f"Done: {file_path}")
+
+    @pyqtSlot(str, str)
+    def _on_file_error(self, file_path: str, message: str):
+        self._log(f"Error: {file_path} -> {message}")
+
+    @pyqtSlot(int, int, str)
+    def _on_progress(self, current: int, total: int, file_path: str):
+        self.current_file_label.setText(f"Processing: {os.path.basename(file_path)}")
+        self.batch_progress.setValue(current)
+        self.progress_updated.emit(current, total)
+
+    @pyqtSlot()
+    def _on_batch_finished(self):
+        """Restore the controls once the worker has returned."""
+        self._worker = None
+        self._thread = None
+
+        if self._stop_requested:
+            self.current_file_label.setText("Processing stopped")
+            self.status_message.emit("Batch processing stopped")
+            self._log("Batch processing stopped")
+        else:
+            total = self.batch_progress.maximum()
+            self.current_file_label.setText(f"Completed {total} file(s)")
+            self.status_message.emit(f"Batch processing completed: {total} files")
 
         self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
 
-    def _stop_processing(self):
-        """Stop batch processing."""
-        self.start_btn.setEnabled(True)
-        self.stop_btn.setEnabled(False)
-        self.current_file_label.setText("Processing stopped")
-        self.status_message.emit("Batch processing stopped")
-        self._log("Batch processing stopped")
+        # Files that arrived in the watch folder while this batch ran
+        self._process_watch_pending()
 
     def _log(self, message: str):
-        """Append a message to the batch log output."""
-        self.log_output.appendPlainText(message)
+        """Queue a message for the batch log output."""
+        self._log_buf.append(message)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self):
+        """Append all queued log messages in one document edit."""
+        if self._log_buf:
+            lines = "\n".join(self._log_buf)
+            self._log_buf.clear()
+            self.log_output.appendPlainText(lines)
 
     def _clear_log(self):
         """Clear batch log output."""
+        self._log_buf.clear()
         self.log_output.clear()
 
-    def _resolve_curve_fill_targets(self, doc):
-        """Resolve container and elements for curve fill."""
-        # 1) Prefer current selection if valid
-        try:
-            selection = corel.get_selection()
-            if selection.Count >= 2:
-                container = selection.Item(1)
-                if hasattr(container, "Curve") and container.Curve is not None:
-                    elements = corel.app.CreateShapeRange()
-                    for idx in range(2, selection.Count + 1):
-                        elements.Add(selection.Item(idx))
-                    return container, elements
-        except Exception:
-            pass
-
-        # 2) Auto-select by name/layer
-        container_name = self.curve_container_name.text().strip().lower()
-        elements_name = self.curve_elements_name.text().strip().lower()
-        layer_name = self.curve_layer_name.text().strip().lower()
-
-        if not (container_name or elements_name or layer_name):
-            return None, None
-
-        shapes = []
-        try:
-            page = doc.ActivePage
-            if page:
-                for i in range(1, page.Shapes.Count + 1):
-                    shapes.append(page.Shapes.Item(i))
-        except Exception:
-            pass
-
-        container = None
-        elements = corel.app.CreateShapeRange()
-
-        for shape in shapes:
-            try:
-                name = (getattr(shape, "Name", "") or "").lower()
-                layer = getattr(shape, "Layer", None)
-                layer_match = False
-                if layer and layer_name:
-                    layer_match = (getattr(layer, "Name", "") or "").lower() == layer_name
-
-                if not container:
-                    if container_name and container_name in name:
-                        if hasattr(shape, "Curve") and shape.Curve is not None:
-                            container = shape
-                    elif layer_match and hasattr(shape, "Curve") and shape.Curve is not None:
-                        container = shape
-
-                if elements_name:
-                    if elements_name in name:
-                        elements.Add(shape)
-                elif layer_match and not (hasattr(shape, "Curve") and shape.Curve is not None):
-                    elements.Add(shape)
-            except Exception:
-                continue
-
-        return container, elements
-
     def apply_preset(self, settings: Dict[str, Any]):
         """Apply preset settings."""
         self.status_message.emit("Batch processor preset applied")
 
     def reset_to_defaults(self):
         """Reset to default values."""
-        self.file_list_widget.clear()
-        self._file_list.clear()
+        self._queue.clear()
         self.output_folder.clear()
         self.naming_pattern.setCurrentIndex(0)
         self.suffix_text.setText("_processed")
@@ -578,5 +1066,5 @@ class BatchProcessorWidget(QWidget):
         self.curve_container_name.clear()
         self.curve_elements_name.clear()
         self.curve_layer_name.clear()
-        self.log_output.clear()
+        self._clear_log()
         self.status_message.emit("Batch processor reset")
@@ -18,6 +18,19 @@ from ...core.corel_interface import (
 logger = logging.getLogger(__name__)
 
 
+def _arange(stop: float, step: float) -> List[float]:
+    """Multiples of step in [0, stop), like numpy.arange(0, stop, step)."""
+    if step <= 0:
+        logger.warning(f"Ignoring non-positive spacing {step}.")
+        return []
+    # k * step rather than a running sum, so error doesn't accumulate
+    positions = [k * step for k in range(math.ceil(stop / step))]
+    if positions and positions[-1] >= stop:
+        # stop / step rounded up past an exact multiple
+        positions.pop()
+    return positions
+
+
 class SpacingMode(Enum):
     """Spacing calculation modes."""
     FIXED = "fixed"
@@ -126,6 +139,13 @@ class CurveFillerEngine:
 
         logger.info("Curve filler engine initialized.")
 
+    def reset(self):
+        """Drop the container, fill elements and placed shapes so the engine can be reused."""
+        self._curve_segments = []
+        self._fill_elements = []
+        self._container_shape = None
+        self._placed_elements = []
+
     def set_container(self, shape):
         """
         Set the container curve/shape to fill.
@@ -192,16 +212,17 @@ class CurveFillerEngine:
         # Determine element positions
         positions = self._calculate_positions(settings, usable_length)
 
+        # Points and tangents for every position in one walk along the curve
+        start = settings.start_padding
+        curve_points = corel.get_points_on_curve(
+            self._curve_segments, [start + distance for distance in positions]
+        )
+
         # Calculate placement for each position
         current_angle = settings.fixed_angle
         current_scale = settings.scale_start
 
-        for i, distance in enumerate(positions):
-            actual_distance = settings.start_padding + distance
-
-            # Get point and tangent on curve
-            point, tangent = corel.get_point_on_curve(self._curve_segments, actual_distance)
-
+        for i, (point, tangent) in enumerate(curve_points):
             # Calculate rotation
             rotation = self._calculate_rotation(settings, tangent, i, current_angle)
             if settings.angle_mode == AngleMode.INCREMENTAL:
@@ -255,22 +276,18 @@ class CurveFillerEngine:
             if settings.distribute_evenly and settings.element_count > 1:
                 # Distribute evenly
                 spacing = usable_length / (settings.element_count - 1)
-                for i in range(settings.element_count):
-                    positions.append(i * spacing)
+                positions = [i * spacing for i in range(settings.element_count)]
             else:
                 spacing = usable_length / settings.element_count
-                for i in range(settings.element_count):
-                    positions.append(i * spacing + spacing / 2)
+                half = spacing / 2
+                positions = [i * spacing + half for i in range(settings.element_count)]
 
         elif settings.spacing_mode == SpacingMode.FIXED:
             # Fixed spacing
             spacing = settings.spacing_value
             if base_size is not None:
                 spacing = base_size + settings.spacing_value
-            distance = 0.0
-            while distance < usable_length:
-                positions.append(distance)
-                distance += spacing
+            positions = _arange(usable_length, spacing)
 
         elif settings.spacing_mode == SpacingMode.PERCENTAGE:
             # Percentage-based spacing (relative to first element size)
@@ -281,11 +298,7 @@ class CurveFillerEngine:
                 else:
                     base_spacing = base_size
                 spacing = base_spacing * (settings.spacing_percentage / 100.0)
-
-                distance = 0.0
-                while distance < usable_length:
-                    positions.append(distance)
-                    distance += spacing
+                positions = _arange(usable_length, spacing)
 
         elif settings.spacing_mode == SpacingMode.AUTO_FIT:
             # Auto-fit: fill the entire curve length
@@ -305,8 +318,7 @@ class CurveFillerEngine:
 
             if count > 1:
                 spacing = usable_length / (count - 1)
-                for i in range(count):
-                    positions.append(i * spacing)
+                positions = [i * spacing for i in range(count)]
             elif count == 1:
                 positions.append(usable_length / 2)
 
@@ -409,10 +421,10 @@ class CurveFillerEngine:
             prev_size = elem_sizes[prev.element_index] * prev.scale
 
             # Check distance
-            min_distance = (current_size + prev_size) / 2
-            actual_distance = prev.position.distance_to(current.position)
+            min_distance = (current_size + prev_size) / 2 * 0.9  # 90% threshold
+            actual_distance_sq = prev.position.distance_squared_to(current.position)
 
-            if actual_distance >= min_distance * 0.9:  # 90% threshold
+            if actual_distance_sq >= min_distance * min_distance:
                 filtered.append(current)
 
         logger.info(f"Collision detection removed {len(placements) - len(filtered)} placements.")
@@ -432,35 +444,41 @@ class CurveFillerEngine:
         if max_size <= 0:
             return placements
 
+        # Buckets hold flat (x, y, half_size) tuples of kept placements, so
+        # the neighbour scan does no attribute or list-index lookups
         cell_size = max_size
-        grid: Dict[Tuple[int, int], List[int]] = {}
+        grid: Dict[Tuple[int, int], List[Tuple[float, float, float]]] = {}
+        get_bucket = grid.get
         kept: List[PlacementPoint] = []
 
-        def _cell_key(p: Point) -> Tuple[int, int]:
-            return (int(p.x // cell_size), int(p.y // cell_size))
-
-        for p in placements:
-            size = elem_sizes[p.element_index] * p.scale
-            cx, cy = _cell_key(p.position)
-            overlap = False
+        def _overlaps(x: float, y: float, half: float, cx: int, cy: int) -> bool:
             for gx in (cx - 1, cx, cx + 1):
                 for gy in (cy - 1, cy, cy + 1):
-                    for idx in grid.get((gx, gy), []):
-                        other = kept[idx]
-                        other_size = elem_sizes[other.element_index] * other.scale
-                        min_dist = (size + other_size) / 2
-                        dx = p.position.x - other.position.x
-                        dy = p.position.y - other.position.y
-                        if (dx * dx + dy * dy) < (min_dist * min_dist):
-                            overlap = True
-                            break
-                    if overlap:
-                        break
-                if overlap:
-                    break
-            if overlap:
+                    bucket = get_bucket((gx, gy))
+                    if bucket is None:
+                        continue
+                    for ox, oy, other_half in bucket:
+                        dx = x - ox
+                        dy = y - oy
+                        min_dist = half + other_half
+                        if dx * dx + dy * dy < min_dist * min_dist:
+                            return True
+            return False
+
+        for p in placements:
+            x = p.position.x
+            y = p.position.y
+            half = elem_sizes[p.element_index] * p.scale * 0.5
+            cx = int(x // cell_size)
+            cy = int(y // cell_size)
+            if _overlaps(x, y, half, cx, cy):
                 continue
-            grid.setdefault((cx, cy), []).append(len(kept))
+            entry = (x, y, half)
+            bucket = get_bucket((cx, cy))
+            if bucket is None:
+                grid[(cx, cy)] = [entry]
+            else:
+                bucket.append(entry)
             kept.append(p)
 
         return kept
@@ -586,6 +586,7 @@ class ObjectToolsWidget(QWidget):
                         cb = corel.get_shape_bounds(container)
                         min_x, min_y = cb.left, cb.bottom
                         max_x, max_y = cb.right, cb.top
+                        inside_container = corel.point_in_shape_tester(container)
                     else:
                         all_bounds = [corel.get_shape_bounds(s) for s in move_shapes]
                         min_x = min(b.left for b in all_bounds)
@@ -604,7 +605,7 @@ class ObjectToolsWidget(QWidget):
                         while tries < 500 and not placed_ok:
                             x = random.uniform(min_x + w / 2, max_x - w / 2)
                             y = random.uniform(min_y + h / 2, max_y - h / 2)
-                            if container and not corel.is_point_in_shape(x, y, container):
+                            if container and not inside_container(x, y):
                                 tries += 1
                                 continue
                             if use_size:
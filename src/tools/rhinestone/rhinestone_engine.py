@@ -6,7 +6,7 @@ Core algorithms for rhinestone design automation.
 import logging
 import math
 import random
-from typing import List, Tuple, Dict, Any, Optional
+from typing import Callable, List, Tuple, Dict, Any, Optional
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -345,6 +345,10 @@ class RhinestoneEngine:
         container_max_x = orig_min_x + orig_width - edge_margin
         container_min_y = orig_min_y + edge_margin
         container_max_y = orig_min_y + orig_height - edge_margin
+        # Read the container outline once instead of querying CorelDRAW per stone
+        inside_container = None
+        if clip_to_container and container_shape:
+            inside_container = corel.point_in_shape_tester(container_shape)
         
         # Center of container for rotation
         center_x = orig_min_x + orig_width / 2
@@ -394,7 +398,7 @@ class RhinestoneEngine:
                         y + stone_radius > container_max_y):
                         continue
                     # Then, clip to actual shape if provided
-                    if container_shape and not corel.is_point_in_shape(x, y, container_shape):
+                    if inside_container and not inside_container(x, y):
                         continue
                 
                 # Check collision if gap optimization is enabled (skip if we do post-process)
@@ -402,9 +406,10 @@ class RhinestoneEngine:
                 if settings and settings.gap_optimization and not settings.remove_overlaps:
                     for p in placements:
                         pd = p.diameter if p.diameter else self.get_stone_diameter(p.stone_size)
-                        dist = math.sqrt((x - p.x) ** 2 + (y - p.y) ** 2)
                         min_dist = (actual_diameter + pd) / 2 + min_gap
-                        if dist < min_dist:
+                        dx = x - p.x
+                        dy = y - p.y
+                        if (dx * dx + dy * dy) < (min_dist * min_dist):
                             can_place = False
                             break
 
@@ -450,11 +455,12 @@ class RhinestoneEngine:
         min_x, min_y = bounds.x, bounds.y
         max_x, max_y = bounds.x + bounds.width, bounds.y + bounds.height
         
+        is_inside = self._shape_tester()
         y = min_y
         while y < max_y:
             x = min_x
             while x < max_x:
-                if self._is_point_in_shape(x, y):
+                if is_inside(x, y):
                     placements.append(RhinestonePlacement(
                         x=x,
                         y=y,
@@ -487,6 +493,7 @@ class RhinestoneEngine:
         
         radius = 0
         angle = 0
+        is_inside = self._shape_tester()
         
         while radius < max_radius:
             num_stones = max(1, int(2 * math.pi * radius / effective_spacing))
@@ -496,7 +503,7 @@ class RhinestoneEngine:
                 x = cx + radius * math.cos(angle)
                 y = cy + radius * math.sin(angle)
                 
-                if self._is_point_in_shape(x, y):
+                if is_inside(x, y):
                     placements.append(RhinestonePlacement(
                         x=x,
                         y=y,
@@ -615,6 +622,7 @@ class RhinestoneEngine:
 
         attempts = 0
         max_attempts = max_stones * 10
+        inside_container = corel.point_in_shape_tester(container_shape) if container_shape else None
 
         while len(placements) < max_stones and attempts < max_attempts:
             x = random.uniform(min_x, min_x + width)
@@ -633,7 +641,7 @@ class RhinestoneEngine:
 
             # Check minimum distance from other placements
             too_close = False
-            if container_shape and not corel.is_point_in_shape(x, y, container_shape):
+            if inside_container and not inside_container(x, y):
                 too_close = True
             if cell_size > 0:
                 cx, cy = _cell_key(x, y)
@@ -876,16 +884,16 @@ class RhinestoneEngine:
         self._stone_count = len(placements)
         return placements
 
-    def _is_point_in_shape(self, x: float, y: float) -> bool:
-        """Check if a point is inside the selected shape."""
+    def _shape_tester(self) -> Callable[[float, float], bool]:
+        """Build a point-in-shape check against the selected shape."""
         if not corel.is_connected:
-            return True  # Assume inside if not connected
+            return lambda x, y: True  # Assume inside if not connected
         
         try:
-            # Use CorelDRAW's geometry check
-            return corel.is_point_in_shape(x, y)
+            # Outline is read from CorelDRAW once, then tested locally per point
+            return corel.point_in_shape_tester()
         except Exception:
-            return True  # Default to inside
+            return lambda x, y: True  # Default to inside
 
     def _get_curve_points(self, shape, spacing: float) -> List[Tuple[float, float]]:
         """Extract points along a curve/path."""
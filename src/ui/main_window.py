@@ -750,6 +750,12 @@ class MainWindow(QMainWindow):
         # Save configuration
         config.save()
 
+        # Let background tool work (e.g. a running batch) finish its COM
+        # calls before the connection goes away
+        for widget in self._tool_widgets.values():
+            if hasattr(widget, "shutdown"):
+                widget.shutdown()
+
         # Disconnect from CorelDRAW
         if corel.is_connected:
             corel.disconnect()
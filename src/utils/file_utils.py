@@ -0,0 +1,33 @@
+"""
+File writing helpers.
+"""
+
+import os
+import shutil
+from pathlib import Path
+from typing import Union
+
+
+def atomic_write_bytes(path: Union[str, Path], data: bytes):
+    """
+    Replace the contents of a file without ever exposing a partial write.
+
+    The data is written to a '.tmp' sibling and swapped in with os.replace,
+    so a crash mid-write leaves the previous file intact. The temporary file
+    is created with the usual umask-derived mode, and an existing file's
+    permissions are carried over to the replacement.
+
+    Args:
+        path: File to write.
+        data: Complete new contents.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        tmp_path.write_bytes(data)
+        if path.exists():
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
@@ -5,6 +5,7 @@ Logging utilities for the application.
 import logging
 import sys
 import json
+import time
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, Any
@@ -14,6 +15,29 @@ from typing import Optional, Dict, Any
 _user_action_logger: Optional[logging.Logger] = None
 
 
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that reuses the formatted timestamp within the same second.
+
+    Bursts of records share one strftime/localtime call; the millisecond
+    part is appended per record, so output matches logging.Formatter.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_time = (None, None, '')  # (second, datefmt, text)
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        second = int(record.created)
+        cached_second, cached_datefmt, text = self._cached_time
+        if second != cached_second or datefmt != cached_datefmt:
+            text = time.strftime(datefmt or self.default_time_format, self.converter(second))
+            self._cached_time = (second, datefmt, text)
+        if datefmt or not self.default_msec_format:
+            return text
+        return self.default_msec_format % (text, record.msecs)
+
+
 def setup_file_logger(name: str, log_dir: Path, level: int = logging.INFO) -> logging.Logger:
     """
     Set up a file logger with rotation.
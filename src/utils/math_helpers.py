@@ -95,7 +95,7 @@ def rotate_point(x: float, y: float, angle: float, cx: float = 0, cy: float = 0)
 
 def distance_2d(x1: float, y1: float, x2: float, y2: float) -> float:
     """Calculate 2D distance between two points."""
-    return math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+    return math.hypot(x2 - x1, y2 - y1)
 
 
 def angle_between_points(x1: float, y1: float, x2: float, y2: float) -> float:
@@ -0,0 +1,20 @@
+"""
+Resource path helpers.
+Locates bundled data files both from a source checkout and a frozen build.
+"""
+
+import sys
+from pathlib import Path
+
+
+def get_resource_root() -> Path:
+    """
+    Get the directory that contains the bundled resources/ tree.
+
+    Returns:
+        The PyInstaller unpack directory (sys._MEIPASS) in a frozen build,
+        otherwise the src/ package directory.
+    """
+    if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
+        return Path(sys._MEIPASS)
+    return Path(__file__).resolve().parents[1]